@@ -0,0 +1,193 @@
+"""Render benchmark: time, frames and memory per scene and quality preset.
+
+Usage:
+    python benchmark.py [FILES...] [-q l -q m -q h] [-s PATTERN] [--repeat N]
+                        [--output FILE] [--baseline FILE] [--threshold 0.10]
+                        [--save-baseline]
+
+Every (scene, quality) pair renders in a freshly spawned interpreter with
+manim's cache disabled and a throwaway media folder, so runs are cold and
+comparable: the wall time includes importing manim, and the peak RSS is the
+render process's own. The results are written as JSON; with --baseline, any
+wall time or peak RSS that grew by more than --threshold makes the run exit
+non-zero.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from render_all import QUALITIES, discover_scenes, render_scene
+
+BENCHMARK_DIR = Path(__file__).resolve().parent / "benchmarks"
+# Metrics compared against the baseline (lower is better)
+TRACKED = ("wall_seconds", "peak_rss_mb")
+
+
+def _peak_rss_mb():
+    # VmHWM belongs to this process image; ru_maxrss is kept across fork and
+    # exec, so it would include the parent's peak
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _measure(conn, path, scene_name, quality):
+    media_dir = tempfile.mkdtemp(prefix="manim-bench-")
+    try:
+        result = render_scene(
+            path,
+            scene_name,
+            quality,
+            media_dir,
+            config_overrides={"disable_caching": True, "progress_bar": "none"},
+        )
+    finally:
+        shutil.rmtree(media_dir, ignore_errors=True)
+    result["peak_rss_mb"] = _peak_rss_mb()
+    conn.send(result)
+    conn.close()
+
+
+def measure(path, scene_name, quality):
+    """Render once in a child process and return its measurements."""
+    # Spawned, not forked: a forked child would inherit this process's imports
+    # and its ru_maxrss
+    ctx = multiprocessing.get_context("spawn")
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_measure, args=(sender, path, scene_name, quality))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {"ok": False, "error": f"benchmark process exited with code {process.exitcode}"}
+    process.join()
+    return result
+
+
+def run(scenes, qualities, repeat=1):
+    rows = []
+    for path, scene_name, _ in scenes:
+        for quality in qualities:
+            runs = [measure(path, scene_name, quality) for _ in range(repeat)]
+            ok = [r for r in runs if r.get("ok")]
+            row = {"file": path.name, "scene": scene_name, "quality": quality, "ok": len(ok) == len(runs)}
+            if ok:
+                best = min(ok, key=lambda r: r["seconds"])
+                row.update(
+                    wall_seconds=best["seconds"],
+                    frames=best["frames"],
+                    fps=best["frames"] / best["seconds"] if best["seconds"] else 0.0,
+                    peak_rss_mb=max(r["peak_rss_mb"] for r in ok),
+                    partial_movies=best["partial_movies"],
+                    plays=best["plays"],
+                )
+            else:
+                row["error"] = runs[-1].get("error", "")
+            rows.append(row)
+            _print_row(row)
+    return rows
+
+
+def _key(row):
+    return f"{row['file']}:{row['scene']}@{row['quality']}"
+
+
+def _print_row(row):
+    label = _key(row)
+    if not row["ok"]:
+        print(f"{label:<55} FAILED\n{row.get('error', '')}", file=sys.stderr, flush=True)
+        return
+    print(
+        f"{label:<55} {row['wall_seconds']:8.2f}s {row['frames']:6d} frames {row['fps']:7.1f} fps"
+        f" {row['peak_rss_mb']:8.1f} MB {row['partial_movies']:4d} partials",
+        flush=True,
+    )
+
+
+def compare(rows, baseline, threshold):
+    """Return human readable regressions of `rows` against `baseline`."""
+    previous = {_key(r): r for r in baseline["results"] if r.get("ok")}
+    regressions = []
+    for row in rows:
+        if not row["ok"]:
+            regressions.append(f"{_key(row)}: failed to render")
+            continue
+        before = previous.get(_key(row))
+        if before is None:
+            continue
+        for metric in TRACKED:
+            if before.get(metric) and row[metric] > before[metric] * (1 + threshold):
+                change = row[metric] / before[metric] - 1
+                regressions.append(f"{_key(row)}: {metric} {before[metric]:.2f} -> {row[metric]:.2f} (+{change:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scene renders.")
+    parser.add_argument("files", nargs="*", help="Scene modules to scan (default: every *.py in the project)")
+    parser.add_argument("-q", "--quality", action="append", choices=sorted(QUALITIES), help="Repeatable; default: l m h")
+    parser.add_argument("-s", "--scene", default="*")
+    parser.add_argument("--repeat", type=int, default=1, help="Renders per pair; the fastest is kept")
+    parser.add_argument("--output", default=str(BENCHMARK_DIR / "latest.json"))
+    parser.add_argument("--baseline", default=None, help="Results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown (default 0.10)")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results to --baseline")
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes(args.files, args.scene)
+    if not scenes:
+        print("No scenes matched.", file=sys.stderr)
+        return 1
+
+    import manim
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "host": platform.node(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "manim": manim.__version__,
+            "cpu_count": os.cpu_count(),
+        },
+        "results": run(scenes, args.quality or ["l", "m", "h"], args.repeat),
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+    if not args.baseline:
+        return 0 if all(r["ok"] for r in report["results"]) else 1
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+    regressions = compare(report["results"], json.loads(baseline_path.read_text()), args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} against {baseline_path}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
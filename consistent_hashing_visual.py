@@ -1,57 +1,90 @@
 from manim import *
-import hashlib
-import bisect
+from hash_ring import HashRing
+from hashers import DEFAULT_HASHER
+from ring_cloud import ring_points
+from text_cache import cached_text
 
-# Simplified ConsistentHashing class for visualization
+# Thin wrapper around HashRing that adds the degree projection used for display
 class ConsistentHashingVisualizer:
-    def __init__(self, num_replicas=3):
+    def __init__(self, num_replicas=3, hasher=DEFAULT_HASHER):
         self.num_replicas = num_replicas
-        self.ring = {}
-        self.sorted_keys = []
-        self.nodes = set()
+        self.ring = HashRing(num_replicas, hasher=hasher)
+
+    @property
+    def nodes(self):
+        return self.ring.nodes
 
     def _hash(self, key):
-        # Simplified hash for visualization (maps to 0-360 degrees)
-        return int(hashlib.sha256(key.encode()).hexdigest(), 16) % 360
+        # Ring position projected to 0-360 degrees; order preserving, so the
+        # drawing agrees with get_node
+        return self.ring.angle(key)
 
     def add_node(self, node):
-        self.nodes.add(node)
-        for i in range(self.num_replicas):
-            key = f"{node}:{i}"
-            hash_val = self._hash(key)
-            self.ring[hash_val] = node
-            bisect.insort(self.sorted_keys, hash_val)
+        self.ring.add_nodes([node])
+
+    def add_nodes(self, nodes):
+        self.ring.add_nodes(nodes)
+
+    def remove_node(self, node):
+        self.ring.remove_nodes([node])
+
+    def remove_nodes(self, nodes):
+        self.ring.remove_nodes(nodes)
+
+    def positions(self, keys, radius=3, center=ORIGIN):
+        # Every key's point on the drawn ring in one call
+        return ring_points(self.ring.hash_many(keys), radius, center)
+
+    def vnode_positions(self, radius=3, center=ORIGIN):
+        """Points of all vnodes in ring order, and the owning node index of each."""
+        return ring_points(self.ring.positions, radius, center), self.ring.owners
 
     def get_node(self, key):
-        if not self.ring:
-            return None
-        hash_val = self._hash(key)
-        index = bisect.bisect(self.sorted_keys, hash_val) % len(self.sorted_keys)
-        return self.ring[self.sorted_keys[index]]
+        return self.ring.get_node(key)
+
+    def get_nodes(self, keys):
+        return self.ring.get_nodes(keys)
 
 class ConsistentHashingScene(Scene):
+    # Ring contents (override per render: ConsistentHashingScene(nodes=[...], num_replicas=...))
+    nodes = ["NodeA", "NodeB", "NodeC"]
+    num_replicas = 3
+    keys = ["apple", "banana", "cherry"]
+    # Node removed in step 5 (default: the second node)
+    node_to_remove = None
+
+    def __init__(self, nodes=None, num_replicas=None, keys=None, node_to_remove=None, **kwargs):
+        if nodes is not None:
+            self.nodes = nodes
+        if num_replicas is not None:
+            self.num_replicas = num_replicas
+        if keys is not None:
+            self.keys = keys
+        if node_to_remove is not None:
+            self.node_to_remove = node_to_remove
+        super().__init__(**kwargs)
+
     def construct(self):
         # Step 1: Draw the hash ring
         ring = Circle(radius=3, color=BLUE)
-        ring_label = Text("Hash Ring").next_to(ring, UP, buff=0.5)
+        ring_label = cached_text("Hash Ring").next_to(ring, UP, buff=0.5)
         self.play(Create(ring), Write(ring_label))
         self.wait(1)
 
         # Step 2: Initialize consistent hashing
-        ch = ConsistentHashingVisualizer(num_replicas=3)
-        nodes = ["NodeA", "NodeB", "NodeC"]
+        ch = ConsistentHashingVisualizer(num_replicas=self.num_replicas)
+        nodes = self.nodes
         node_dots = {}
         labels = {}
 
         # Step 3: Add nodes and their replicas
         for node in nodes:
             ch.add_node(node)
-            for i in range(3):  # 3 replicas
-                key = f"{node}:{i}"
-                angle = ch._hash(key) * DEGREES  # Convert to radians
-                pos = ring.point_at_angle(angle)
+            replica_keys = [f"{node}:{i}" for i in range(self.num_replicas)]
+            replica_positions = ch.positions(replica_keys, ring.radius, ring.get_center())
+            for i, (key, pos) in enumerate(zip(replica_keys, replica_positions)):
                 dot = Dot(pos, color=YELLOW if i == 0 else GREEN)
-                label = Text(f"{node}:{i}", font_size=20).next_to(pos, direction=pos/np.linalg.norm(pos), buff=0.1)
+                label = cached_text(f"{node}:{i}", font_size=20).next_to(pos, direction=pos/np.linalg.norm(pos), buff=0.1)
                 node_dots[key] = dot
                 labels[key] = label
                 self.play(FadeIn(dot), Write(label), run_time=0.5)
@@ -59,19 +92,16 @@ class ConsistentHashingScene(Scene):
         self.wait(1)
 
         # Step 4: Map some keys
-        keys = ["apple", "banana", "cherry"]
+        keys = self.keys
         key_dots = {}
-        for key in keys:
-            key_hash = ch._hash(key)
-            angle = key_hash * DEGREES
-            key_pos = ring.point_at_angle(angle)
+        for key, key_pos in zip(keys, ch.positions(keys, ring.radius, ring.get_center())):
             key_dot = Dot(key_pos, color=RED)
-            key_label = Text(key, font_size=20, color=RED).next_to(key_dot, RIGHT, buff=0.1)
+            key_label = cached_text(key, font_size=20, color=RED).next_to(key_dot, RIGHT, buff=0.1)
             self.play(FadeIn(key_dot), Write(key_label), run_time=0.5)
 
             # Find the target node
             target_node = ch.get_node(key)
-            for i in range(3):
+            for i in range(self.num_replicas):
                 node_key = f"{target_node}:{i}"
                 if node_key in node_dots:
                     target_pos = node_dots[node_key].get_center()
@@ -84,23 +114,21 @@ class ConsistentHashingScene(Scene):
         self.wait(1)
 
         # Step 5: Remove NodeB and update
-        node_to_remove = "NodeB"
-        self.play(Write(Text(f"Removing {node_to_remove}", font_size=30).to_edge(DOWN)))
-        for i in range(3):
+        node_to_remove = self.node_to_remove or nodes[min(1, len(nodes) - 1)]
+        self.play(Write(cached_text(f"Removing {node_to_remove}", font_size=30).to_edge(DOWN)))
+        for i in range(self.num_replicas):
             key = f"{node_to_remove}:{i}"
             if key in node_dots:
                 self.play(FadeOut(node_dots[key]), FadeOut(labels[key]), run_time=0.5)
                 del node_dots[key]
                 del labels[key]
-        ch.nodes.remove(node_to_remove)
-        ch.ring = {k: v for k, v in ch.ring.items() if v != node_to_remove}
-        ch.sorted_keys = sorted(ch.ring.keys())
+        ch.remove_node(node_to_remove)
 
         # Step 6: Reassign keys
         for key in keys:
             target_node = ch.get_node(key)
             key_dot, key_label = key_dots[key]
-            for i in range(3):
+            for i in range(self.num_replicas):
                 node_key = f"{target_node}:{i}"
                 if node_key in node_dots:
                     target_pos = node_dots[node_key].get_center()
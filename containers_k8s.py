@@ -1,6 +1,32 @@
 from manim import *
+import numpy as np
+
+from pod_scheduler import simulate
+from text_cache import cached_text
+
+def utilization_pixels(util, cols):
+    # One pixel per node: empty nodes dark, then blue -> yellow -> red as they fill up
+    rows = -(-len(util) // cols)
+    padded = np.full(rows * cols, np.nan)
+    padded[: len(util)] = util
+    stops = np.array([color_to_rgb(c) for c in (BLUE, YELLOW, RED)])
+    rgb = np.stack([np.interp(padded, [0, 0.5, 1], stops[:, i]) for i in range(3)], axis=-1)
+    rgb[~(padded > 0)] = color_to_rgb(GREY_E)
+    pixels = np.full((len(padded), 4), 255, dtype=np.uint8)
+    pixels[:, :3] = (rgb * 255).astype(np.uint8)
+    # Padding cells are transparent
+    pixels[np.isnan(padded), 3] = 0
+    return pixels.reshape(rows, cols, 4)
+
 
 class ContainersAndKubernetes(Scene):
+    # Cluster simulated for the last step, drawn as one image per strategy
+    num_nodes = 1000
+    num_pods = 100_000
+    drain = 50
+    grid_cols = 40
+    replay_seconds = 10
+
     def construct(self):
         # Title
         title = Text("Containers & Kubernetes", font_size=40)
@@ -46,4 +72,49 @@ class ContainersAndKubernetes(Scene):
         # Fade out everything
         self.play(FadeOut(VGroup(title, container_group, container2, container3, scaling_text, k8s_box, k8s_label, arrows, relation_text)))
 
+        # Step 4: The scheduler at cluster scale, one pixel per node
+        runs = {strategy: simulate(self.num_nodes, self.num_pods, strategy, self.drain)[1] for strategy in ("binpack", "spread")}
+        labels = [label for label, _, _ in runs["binpack"]]
+        heading = cached_text(f"Scheduling {self.num_pods:,} pods on {self.num_nodes:,} nodes", font_size=32).to_edge(UP)
+        grids = Group()
+        for strategy, history in runs.items():
+            grid = ImageMobject(utilization_pixels(np.zeros(self.num_nodes), self.grid_cols))
+            grid.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"]).set_height(3)
+            grid.history = np.array([util for _, util, _ in history])
+            grids.add(Group(grid, cached_text(strategy, font_size=26).next_to(grid, UP)))
+        grids.arrange(RIGHT, buff=1.5)
+        self.play(Write(heading), FadeIn(grids))
+
+        clock = ValueTracker(0)
+
+        def refill(grid):
+            t = clock.get_value()
+            s = min(int(t), len(grid.history) - 1)
+            frac = t - s
+            util = grid.history[s] * (1 - frac) + grid.history[min(s + 1, len(grid.history) - 1)] * frac
+            grid.pixel_array = utilization_pixels(util, self.grid_cols)
+
+        def caption_for(s):
+            in_use = "   ".join(f"{name}: {history[s][2]['nodes_in_use']:,} nodes in use" for name, history in runs.items())
+            return VGroup(cached_text(labels[s], font_size=24), cached_text(in_use, font_size=20)).arrange(DOWN).to_edge(DOWN)
+
+        caption = caption_for(0)
+        caption.snapshot = 0
+
+        def update_caption(mob):
+            s = min(int(clock.get_value()), len(labels) - 1)
+            if s != mob.snapshot:
+                mob.become(caption_for(s))
+                mob.snapshot = s
+
+        for group in grids:
+            group[0].add_updater(refill)
+        caption.add_updater(update_caption)
+        self.add(caption)
+        self.play(clock.animate.set_value(len(labels) - 1), run_time=self.replay_seconds, rate_func=linear)
+        for group in grids:
+            group[0].clear_updaters()
+        caption.clear_updaters()
+        self.wait(2)
+
 # To run this, use: manim -pql script_name.py ContainersAndKubernetes
\ No newline at end of file
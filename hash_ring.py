@@ -0,0 +1,135 @@
+"""Array-backed consistent hash ring.
+
+Virtual node positions are 64-bit hashes kept in a sorted NumPy array, with a
+parallel array of owner indices, so lookups are a single searchsorted and
+adding or removing many nodes is one bulk array operation.
+
+    ring = HashRing(num_replicas=200)
+    ring.add_nodes([f"node{i}" for i in range(10_000)])
+    owners = ring.get_nodes(keys)        # vectorized
+    ring.remove_nodes(["node42"])
+
+The key hash is pluggable (see hashers.py): HashRing(200, hasher="fnv1a").
+"""
+import numpy as np
+
+from hashers import DEFAULT_HASHER, get_hasher
+
+RING_SIZE = 2**64
+
+
+class HashRing:
+    def __init__(self, num_replicas=3, hasher=DEFAULT_HASHER):
+        self.num_replicas = num_replicas
+        self.hasher = get_hasher(hasher)
+        # Node indices are never reused, so owner arrays stay valid across removals
+        self.node_names = []
+        self._index = {}
+        self._active = set()
+        self.positions = np.empty(0, dtype=np.uint64)
+        self.owners = np.empty(0, dtype=np.int64)
+        self.replicas = np.empty(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def nodes(self):
+        return set(self._active)
+
+    def hash(self, key):
+        return self.hasher.hash(key)
+
+    def hash_many(self, keys):
+        return self.hasher.hash_many(keys)
+
+    def angle(self, key):
+        """Position of `key` on the ring in degrees (order preserving)."""
+        return self.hash(key) / RING_SIZE * 360
+
+    def node_index(self, node):
+        return self._index[node]
+
+    def add_nodes(self, nodes):
+        nodes = [n for n in dict.fromkeys(nodes) if n not in self._active]
+        if not nodes:
+            return
+        indices = []
+        for node in nodes:
+            if node not in self._index:
+                self._index[node] = len(self.node_names)
+                self.node_names.append(node)
+            indices.append(self._index[node])
+            self._active.add(node)
+
+        replicas = np.tile(np.arange(self.num_replicas), len(nodes))
+        owners = np.repeat(np.asarray(indices, dtype=np.int64), self.num_replicas)
+        positions = self.hash_many([f"{node}:{i}" for node in nodes for i in range(self.num_replicas)])
+        positions, owners, replicas = self._sorted(positions, owners, replicas)
+
+        slots = np.searchsorted(self.positions, positions)
+        clipped = np.minimum(slots, max(len(self.positions) - 1, 0))
+        if len(self.positions) and np.any(self.positions[clipped] == positions):
+            # A new vnode lands exactly on an existing one: re-sort everything
+            self.positions, self.owners, self.replicas = self._sorted(
+                np.concatenate([self.positions, positions]),
+                np.concatenate([self.owners, owners]),
+                np.concatenate([self.replicas, replicas]),
+            )
+        else:
+            # Otherwise merge the sorted batch in with one linear pass
+            self.positions = np.insert(self.positions, slots, positions)
+            self.owners = np.insert(self.owners, slots, owners)
+            self.replicas = np.insert(self.replicas, slots, replicas)
+
+    def add_node(self, node):
+        self.add_nodes([node])
+
+    def remove_nodes(self, nodes):
+        nodes = list(nodes)  # iterated twice below
+        indices = [self._index[n] for n in nodes if n in self._active]
+        if not indices:
+            return
+        self._active.difference_update(nodes)
+        keep = ~np.isin(self.owners, indices)
+        # Filtering a sorted array keeps it sorted
+        self.positions = self.positions[keep]
+        self.owners = self.owners[keep]
+        self.replicas = self.replicas[keep]
+
+    def remove_node(self, node):
+        self.remove_nodes([node])
+
+    def _sorted(self, positions, owners, replicas):
+        # Vnodes that collide on a position are all kept, ordered by node name
+        # then replica, so the result does not depend on insertion order
+        names = np.asarray(self.node_names)
+        name_rank = np.empty(len(names), dtype=np.int64)
+        name_rank[np.argsort(names, kind="stable")] = np.arange(len(names))
+        order = np.lexsort((replicas, name_rank[owners], positions))
+        return positions[order], owners[order], replicas[order]
+
+    def lookup(self, hashes):
+        """Owner node indices for an array of 64-bit key hashes."""
+        if not len(self.positions):
+            raise LookupError("hash ring is empty")
+        slots = np.searchsorted(self.positions, np.asarray(hashes, dtype=np.uint64), side="right")
+        slots[slots == len(self.positions)] = 0  # wrap around the ring
+        return self.owners[slots]
+
+    def get_node_indices(self, keys):
+        return self.lookup(self.hash_many(keys))
+
+    def get_nodes(self, keys):
+        names = np.asarray(self.node_names, dtype=object)
+        return names[self.get_node_indices(keys)]
+
+    def get_node(self, key):
+        if not len(self.positions):
+            return None
+        return self.node_names[int(self.lookup([self.hash(key)])[0])]
+
+    def vnodes(self, node):
+        """(replica, position) pairs of one node, in ring order."""
+        mask = self.owners == self._index[node]
+        return list(zip(self.replicas[mask].tolist(), self.positions[mask].tolist()))
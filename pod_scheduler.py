@@ -0,0 +1,177 @@
+"""Array-backed pod scheduling simulator.
+
+    python pod_scheduler.py --nodes 1000 --pods 100000 --strategy binpack --drain 50
+
+Node capacities and usage are NumPy arrays, so scoring every node for a pod
+is a handful of vectorized operations: `binpack` picks the feasible node
+that ends up most allocated (Kubernetes' MostAllocated), `spread` the least
+allocated one (LeastAllocated). Pods arrive in order; along the way some
+finish and some nodes are drained, which evicts their pods and reschedules
+them. Utilization is snapshotted at regular intervals for the scene.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+STRATEGIES = ("binpack", "spread")
+# (cpu cores, memory GiB) per node type, and how common each type is
+NODE_TYPES = [(32, 128), (64, 256), (96, 384)]
+NODE_WEIGHTS = [0.5, 0.35, 0.15]
+# Pod requests, mostly small
+POD_SHAPES = [(0.1, 0.25), (0.25, 0.5), (0.5, 1), (1, 2), (2, 8)]
+POD_WEIGHTS = [0.35, 0.3, 0.2, 0.1, 0.05]
+
+
+class Cluster:
+    def __init__(self, cpu_capacity, mem_capacity, strategy="binpack"):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy {strategy!r}; choose from {', '.join(STRATEGIES)}")
+        self.strategy = strategy
+        self.cpu_capacity = np.asarray(cpu_capacity, dtype=np.float64)
+        self.mem_capacity = np.asarray(mem_capacity, dtype=np.float64)
+        self.cpu_used = np.zeros_like(self.cpu_capacity)
+        self.mem_used = np.zeros_like(self.mem_capacity)
+        # Drained nodes keep their capacity for reporting but accept no pods
+        self.schedulable = np.ones(len(self.cpu_capacity), dtype=bool)
+        self._cpu_scale = 1 / self.cpu_capacity
+        self._mem_scale = 1 / self.mem_capacity
+        self.pod_node = np.empty(0, dtype=np.int64)
+        self.pod_cpu = np.empty(0)
+        self.pod_mem = np.empty(0)
+
+    def __len__(self):
+        return len(self.cpu_capacity)
+
+    def add_pods(self, cpu, mem):
+        """Register pods (unscheduled); returns their ids."""
+        first = len(self.pod_node)
+        self.pod_node = np.concatenate([self.pod_node, np.full(len(cpu), -1)])
+        self.pod_cpu = np.concatenate([self.pod_cpu, cpu])
+        self.pod_mem = np.concatenate([self.pod_mem, mem])
+        return np.arange(first, len(self.pod_node))
+
+    def score(self, cpu, mem):
+        """Score of every node for one pod; -inf where it does not fit."""
+        cpu_after = (self.cpu_used + cpu) * self._cpu_scale
+        mem_after = (self.mem_used + mem) * self._mem_scale
+        fits = (cpu_after <= 1) & (mem_after <= 1) & self.schedulable
+        allocated = cpu_after + mem_after
+        return np.where(fits, allocated if self.strategy == "binpack" else -allocated, -np.inf)
+
+    def schedule(self, pods):
+        """Place pods one after another; returns how many stayed pending."""
+        pending = 0
+        for pod in pods.tolist():
+            cpu, mem = self.pod_cpu[pod], self.pod_mem[pod]
+            scores = self.score(cpu, mem)
+            node = int(scores.argmax())
+            if scores[node] == -np.inf:
+                pending += 1
+                continue
+            self.pod_node[pod] = node
+            self.cpu_used[node] += cpu
+            self.mem_used[node] += mem
+        return pending
+
+    def _release(self, pods):
+        nodes = self.pod_node[pods]
+        np.subtract.at(self.cpu_used, nodes, self.pod_cpu[pods])
+        np.subtract.at(self.mem_used, nodes, self.pod_mem[pods])
+        self.pod_node[pods] = -1
+
+    def finish(self, pods):
+        """Remove completed pods from their nodes."""
+        pods = pods[self.pod_node[pods] >= 0]
+        self._release(pods)
+        # Never rescheduled: mark them as gone
+        self.pod_node[pods] = -2
+
+    def drain(self, nodes):
+        """Cordon nodes and evict their pods; returns the evicted pod ids."""
+        self.schedulable[nodes] = False
+        evicted = np.flatnonzero(np.isin(self.pod_node, nodes))
+        self._release(evicted)
+        return evicted
+
+    def pending(self):
+        return np.flatnonzero(self.pod_node == -1)
+
+    def utilization(self):
+        return np.maximum(self.cpu_used * self._cpu_scale, self.mem_used * self._mem_scale)
+
+    def stats(self):
+        util = self.utilization()
+        running = self.pod_node >= 0
+        return {
+            "running": int(running.sum()),
+            "pending": int((self.pod_node == -1).sum()),
+            "nodes_in_use": int((self.cpu_used > 1e-9).sum()),
+            "mean_utilization": float(util[self.schedulable].mean()) if self.schedulable.any() else 0.0,
+            "cpu_allocated": float(self.cpu_used.sum() / self.cpu_capacity[self.schedulable].sum()),
+        }
+
+
+def random_cluster(num_nodes, strategy="binpack", seed=0):
+    rng = np.random.default_rng(seed)
+    types = np.asarray(NODE_TYPES, dtype=np.float64)[rng.choice(len(NODE_TYPES), size=num_nodes, p=NODE_WEIGHTS)]
+    return Cluster(types[:, 0], types[:, 1], strategy)
+
+
+def random_pods(num_pods, seed=0):
+    rng = np.random.default_rng(seed + 1)
+    shapes = np.asarray(POD_SHAPES)[rng.choice(len(POD_SHAPES), size=num_pods, p=POD_WEIGHTS)]
+    return shapes[:, 0], shapes[:, 1]
+
+
+def simulate(num_nodes, num_pods, strategy="binpack", drain=0, finish=0.1, snapshots=10, seed=0):
+    """Schedule `num_pods` in `snapshots` waves; in the middle wave a fraction
+    `finish` of running pods completes and `drain` nodes are drained.
+
+    Returns the cluster and a list of snapshots (label, per-node utilization, stats).
+    """
+    rng = np.random.default_rng(seed + 2)
+    cluster = random_cluster(num_nodes, strategy, seed)
+    cpu, mem = random_pods(num_pods, seed)
+    history = []
+    for i, wave in enumerate(np.array_split(np.arange(num_pods), snapshots)):
+        if i == snapshots // 2 and (drain or finish):
+            running = np.flatnonzero(cluster.pod_node >= 0)
+            cluster.finish(rng.choice(running, size=int(len(running) * finish), replace=False))
+            evicted = cluster.drain(rng.choice(len(cluster), size=drain, replace=False))
+            cluster.schedule(evicted)
+            history.append((f"{drain} nodes drained, {len(evicted):,} pods evicted", cluster.utilization(), cluster.stats()))
+        # Pods left pending earlier get another chance before the new ones
+        retry = cluster.pending()
+        cluster.schedule(np.concatenate([retry, cluster.add_pods(cpu[wave], mem[wave])]))
+        history.append((f"{wave[-1] + 1:,} pods submitted", cluster.utilization(), cluster.stats()))
+    return cluster, history
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate pod scheduling on a large cluster.")
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--pods", type=int, default=100_000)
+    parser.add_argument("--strategy", choices=STRATEGIES, default="binpack")
+    parser.add_argument("--drain", type=int, default=50, help="Nodes drained halfway through")
+    parser.add_argument("--finish", type=float, default=0.1, help="Fraction of running pods that complete halfway")
+    parser.add_argument("--snapshots", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    _, history = simulate(args.nodes, args.pods, args.strategy, args.drain, args.finish, args.snapshots, args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"{args.pods:,} pods on {args.nodes:,} nodes ({args.strategy}) in {elapsed:.1f}s")
+    print(f"{'snapshot':<42} {'running':>8} {'pending':>8} {'in use':>7} {'mean util':>9} {'cpu alloc':>9}")
+    for label, _, s in history:
+        print(
+            f"{label:<42} {s['running']:>8,} {s['pending']:>8,} {s['nodes_in_use']:>7,}"
+            f" {s['mean_utilization']:>9.1%} {s['cpu_allocated']:>9.1%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
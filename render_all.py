@@ -0,0 +1,261 @@
+"""Render every Scene in the project on a process pool.
+
+Usage:
+    python render_all.py [FILES...] [-q l|m|h|p|k] [-s PATTERN] [-j JOBS]
+
+Scenes are discovered by parsing the project's modules (manim is only
+imported inside the workers), so each worker pays the manim import once and
+then renders as many scenes as it is handed.
+"""
+import argparse
+import ast
+import fnmatch
+import importlib.util
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent
+
+# Same letters as manim's -q flag
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def _base_name(node):
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return getattr(node, "id", "")
+
+
+def _count_segments(class_node):
+    # Number of self.play / self.wait calls, used to start long scenes first
+    count = 0
+    for node in ast.walk(class_node):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in ("play", "wait")
+        ):
+            count += 1
+    return count
+
+
+def discover_scenes(files=None, pattern="*"):
+    """Return (path, scene_name, weight) for every Scene subclass found.
+
+    `pattern` is matched (fnmatch) against both `Scene` and `file:Scene`, so
+    `consistent_hash_v2:*` selects a single module.
+    """
+    paths = [Path(f).resolve() for f in files] if files else sorted(PROJECT_DIR.glob("*.py"))
+    scenes = []
+    for path in paths:
+        tree = ast.parse(path.read_text(), filename=str(path))
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            if not any(_base_name(base).endswith("Scene") for base in node.bases):
+                continue
+            qualified = f"{path.stem}:{node.name}"
+            if fnmatch.fnmatch(node.name, pattern) or fnmatch.fnmatch(qualified, pattern):
+                scenes.append((path, node.name, _count_segments(node)))
+    return scenes
+
+
+def load_scene_class(path, scene_name):
+    path = Path(path).resolve()
+    # Prefixed so that e.g. test.py does not shadow the stdlib `test` package
+    module_name = f"_scenes_{path.stem}"
+    module = sys.modules.get(module_name)
+    if module is None or getattr(module, "__file__", None) != str(path):
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def make_renderer(cache_dir=None, cache_size=None, writer_mixins=(), holds=False):
+    """Build a CairoRenderer whose file writer carries the requested extensions.
+
+    `writer_mixins` are SceneFileWriter mixins layered under the render cache;
+    `holds` converts the frame of a frozen segment once (render_holds.py).
+    Returns None (manim's default renderer) when no extension is enabled.
+    """
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    mixins = []
+    attrs = {}
+    if cache_dir:
+        from render_cache import DEFAULT_MAX_SIZE, CachedSegmentsMixin, RenderCache
+
+        mixins.append(CachedSegmentsMixin)
+        attrs["render_cache"] = RenderCache(cache_dir, cache_size or DEFAULT_MAX_SIZE)
+    mixins.extend(writer_mixins)
+    if holds:
+        from render_holds import HeldFramesMixin
+
+        mixins.append(HeldFramesMixin)
+    if not mixins:
+        return None
+    file_writer_class = type("ProjectFileWriter", (*mixins, SceneFileWriter), attrs)
+    return CairoRenderer(file_writer_class=file_writer_class)
+
+
+def render_scene(
+    path,
+    scene_name,
+    quality="l",
+    media_dir="media",
+    cache_dir=None,
+    cache_size=None,
+    config_overrides=None,
+    writer_mixins=(),
+    holds=False,
+    scene_kwargs=None,
+):
+    """Render one scene in the current process and return a status dict.
+
+    `config_overrides` is merged into the manim config for this render only;
+    `writer_mixins` and `holds` are passed on to make_renderer and
+    `scene_kwargs` to the scene's constructor (e.g. TwoSumScene(nums=...)).
+    """
+    path = Path(path).resolve()
+    result = {"file": path.name, "scene": scene_name, "quality": quality}
+    start = time.perf_counter()
+    try:
+        from manim import config, tempconfig
+
+        settings = {
+            "quality": QUALITIES[quality],
+            "media_dir": str(media_dir),
+            "input_file": str(path),
+            "preview": False,
+            **(config_overrides or {}),
+        }
+        if cache_dir:
+            import text_cache
+
+            text_cache.enable_disk_cache(Path(cache_dir) / "text")
+        with tempconfig(settings):
+            scene_class = load_scene_class(path, scene_name)
+            scene = scene_class(
+                renderer=make_renderer(cache_dir, cache_size, writer_mixins, holds), **(scene_kwargs or {})
+            )
+            scene.render()
+            renderer = scene.renderer
+            writer = renderer.file_writer
+            result["output"] = str(getattr(writer, "movie_file_path", "") or "")
+            result["plays"] = renderer.num_plays
+            result["frames"] = int(round(renderer.time * config.frame_rate))
+            result["partial_movies"] = sum(1 for f in getattr(writer, "partial_movie_files", []) if f)
+            result["held_frames"] = getattr(writer, "held_frames", 0)
+            result["coalesced"] = getattr(writer, "files_saved", 0)
+        result["ok"] = True
+        if "text_cache" in sys.modules:
+            result["text_cache"] = sys.modules["text_cache"].snapshot(reset=True)
+    except Exception:
+        result["ok"] = False
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _warm_up():
+    # Pay the manim import once per worker, not once per scene
+    try:
+        import manim  # noqa: F401
+    except ImportError:
+        pass  # reported per scene by render_scene
+
+
+def render_all(
+    scenes, quality="l", media_dir="media", jobs=None, cache_dir=None, cache_size=None, holds=False, writer_mixins=()
+):
+    # Longest scenes first so the batch finishes close to the slowest one
+    scenes = sorted(scenes, key=lambda s: s[2], reverse=True)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(scenes)))
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_warm_up) as pool:
+        futures = [
+            pool.submit(
+                render_scene, path, name, quality, media_dir, cache_dir, cache_size,
+                writer_mixins=writer_mixins, holds=holds,
+            )
+            for path, name, _ in scenes
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            _report(result)
+    return results
+
+
+def _report(result):
+    status = " ok " if result["ok"] else "FAIL"
+    label = f"{result['file']}:{result['scene']}"
+    print(f"[{status}] {label:<50} {result['seconds']:7.1f}s  {result.get('output', '')}", flush=True)
+    if "text_cache" in result:
+        tc = result["text_cache"]
+        print(f"       text cache: {tc['hits'] + tc['disk_hits']} reused, {tc['misses']} built, {tc['saved_seconds']:.2f}s saved")
+    if result.get("held_frames"):
+        print(f"       static holds: {result['held_frames']} frames encoded without converting them again")
+    if result.get("coalesced"):
+        print(f"       coalescing: {result['coalesced']} partial movies and encoder opens saved")
+    if not result["ok"]:
+        print(result["error"], file=sys.stderr, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render all scenes in parallel.")
+    parser.add_argument("files", nargs="*", help="Scene modules to scan (default: every *.py in the project)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-s", "--scene", default="*", help="Scene filter, e.g. 'TwoSum*' or 'consistent_hash_v2:*'")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--cache-dir", default=None, help="Render cache location (default: .render_cache)")
+    parser.add_argument("--cache-size", default=None, help="Render cache size limit, e.g. 500M or 2G")
+    parser.add_argument("--no-cache", action="store_true", help="Do not use the persistent render cache")
+    parser.add_argument("--holds", action="store_true", help="Convert the frame of a static hold once")
+    parser.add_argument("--coalesce", action="store_true", help="Encode runs of short plays as one partial movie")
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes(args.files, args.scene)
+    if not scenes:
+        print("No scenes matched.", file=sys.stderr)
+        return 1
+
+    cache_dir = None
+    if not args.no_cache:
+        from render_cache import DEFAULT_DIR
+
+        cache_dir = args.cache_dir or DEFAULT_DIR
+
+    writer_mixins = ()
+    if args.coalesce:
+        from render_coalesce import CoalescingWriterMixin
+
+        writer_mixins = (CoalescingWriterMixin,)
+
+    start = time.perf_counter()
+    results = render_all(
+        scenes, args.quality, args.media_dir, args.jobs, cache_dir, args.cache_size, args.holds, writer_mixins
+    )
+    wall = time.perf_counter() - start
+    failed = [r for r in results if not r["ok"]]
+    serial = sum(r["seconds"] for r in results)
+    print(f"{len(results) - len(failed)}/{len(results)} scenes rendered in {wall:.1f}s wall ({serial:.1f}s of scene time)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""Persistent, content-addressed cache of rendered play/wait segments.
+
+manim already names every partial movie after a hash of the play call (the
+animations, the scene's mobjects and the camera), but those files live under
+media/ and are lost on `make clean`. This cache keeps a copy of every segment
+under .render_cache/, keyed by that hash plus the scene and quality settings,
+and copies hits back into the partial movie folder so manim splices them in
+instead of re-rendering.
+
+Usage:
+    python render_cache.py stats
+    python render_cache.py prune [--max-size 2G]
+    python render_cache.py clear
+"""
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_DIR = os.environ.get("RENDER_CACHE_DIR", str(Path(__file__).resolve().parent / ".render_cache"))
+DEFAULT_MAX_SIZE = os.environ.get("RENDER_CACHE_SIZE", "2G")
+
+_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_size(value):
+    value = str(value).strip().upper().rstrip("B")
+    unit = value[-1] if value and value[-1] in _UNITS else ""
+    return int(float(value[: len(value) - len(unit)]) * _UNITS[unit])
+
+
+class RenderCache:
+    def __init__(self, root=DEFAULT_DIR, max_size=DEFAULT_MAX_SIZE):
+        self.root = Path(root)
+        self.max_bytes = parse_size(max_size)
+        self.segments = self.root / "segments"
+        self.stats_file = self.root / "stats.json"
+        self.counts = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def key(*parts):
+        return hashlib.sha256("\0".join(str(p) for p in parts).encode()).hexdigest()
+
+    def _path(self, key, suffix):
+        return self.segments / key[:2] / f"{key}{suffix}"
+
+    def lookup(self, key, suffix):
+        path = self._path(key, suffix)
+        if path.exists():
+            os.utime(path)  # mtime doubles as the LRU timestamp
+            self.counts["hits"] += 1
+            return path
+        self.counts["misses"] += 1
+        return None
+
+    def store(self, key, source):
+        source = Path(source)
+        path = self._path(key, source.suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Copy rather than hard link: encoders overwrite partial movies in place
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, path)
+        self.counts["stores"] += 1
+
+    def entries(self):
+        if not self.segments.exists():
+            return []
+        return [(p, p.stat()) for p in self.segments.glob("*/*") if not p.name.endswith(".tmp")]
+
+    def size(self):
+        return sum(st.st_size for _, st in self.entries())
+
+    def evict(self, max_bytes=None):
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self.entries(), key=lambda e: e[1].st_mtime)
+        total = sum(st.st_size for _, st in entries)
+        for path, st in entries:
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            self.counts["evictions"] += 1
+        return total
+
+    @contextmanager
+    def _locked(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def read_stats(self):
+        if self.stats_file.exists():
+            return json.loads(self.stats_file.read_text())
+        return {name: 0 for name in self.counts}
+
+    def flush(self):
+        """Merge this process's counters into stats.json and enforce the size limit."""
+        with self._locked():
+            self.evict()
+            stats = self.read_stats()
+            for name, value in self.counts.items():
+                stats[name] = stats.get(name, 0) + value
+            self.stats_file.write_text(json.dumps(stats, indent=2))
+        counts, self.counts = self.counts, {name: 0 for name in self.counts}
+        return counts
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class CachedSegmentsMixin:
+    """SceneFileWriter mixin that backs partial movies with a RenderCache."""
+
+    render_cache = None
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        self.cache_scene_name = scene_name
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def _segment_key(self, hash_invocation):
+        from manim import __version__, config
+
+        return RenderCache.key(
+            __version__,
+            config.get_dir("input_file").name if config["input_file"] else "",
+            self.cache_scene_name,
+            config.pixel_width,
+            config.pixel_height,
+            config.frame_rate,
+            config.background_color,
+            config.transparent,
+            hash_invocation,
+        )
+
+    def is_already_cached(self, hash_invocation):
+        if super().is_already_cached(hash_invocation):
+            self.render_cache.counts["hits"] += 1
+            return True
+        if not hasattr(self, "partial_movie_directory"):
+            return False
+        from manim import config
+
+        suffix = config["movie_file_extension"]
+        cached = self.render_cache.lookup(self._segment_key(hash_invocation), suffix)
+        if cached is None:
+            return False
+        shutil.copyfile(cached, self.partial_movie_directory / f"{hash_invocation}{suffix}")
+        return True
+
+    def end_animation(self, allow_write=False):
+        super().end_animation(allow_write)
+        if not allow_write or not hasattr(self, "partial_movie_directory"):
+            return
+        path = self.partial_movie_files[self.renderer.num_plays]
+        if path is None or Path(path).stem.startswith("uncached_"):
+            return
+        self.render_cache.store(self._segment_key(Path(path).stem), path)
+
+    def finish(self):
+        super().finish()
+        from manim import logger
+
+        counts = self.render_cache.flush()
+        logger.info(
+            "Render cache: %(hits)d hit(s), %(misses)d miss(es), %(stores)d stored, %(evictions)d evicted",
+            counts,
+        )
+
+
+def _format_size(n):
+    for unit in ("B", "K", "M", "G"):
+        if n < 1024 or unit == "G":
+            return f"{n:.1f}{unit}" if unit != "B" else f"{n}B"
+        n /= 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or trim the render cache.")
+    parser.add_argument("command", choices=["stats", "prune", "clear"])
+    parser.add_argument("--cache-dir", default=DEFAULT_DIR)
+    parser.add_argument("--max-size", default=DEFAULT_MAX_SIZE)
+    args = parser.parse_args(argv)
+
+    cache = RenderCache(args.cache_dir, args.max_size)
+    if args.command == "clear":
+        cache.clear()
+        print(f"Removed {cache.root}")
+    elif args.command == "prune":
+        with cache._locked():
+            total = cache.evict()
+        print(f"Pruned {cache.counts['evictions']} segment(s), {_format_size(total)} left")
+    else:
+        stats = cache.read_stats()
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        ratio = stats.get("hits", 0) / lookups if lookups else 0.0
+        print(f"Cache dir : {cache.root}")
+        print(f"Segments  : {len(cache.entries())} ({_format_size(cache.size())} of {_format_size(cache.max_bytes)})")
+        print(f"Hits      : {stats.get('hits', 0)} ({ratio:.0%} of lookups)")
+        print(f"Misses    : {stats.get('misses', 0)}")
+        print(f"Stored    : {stats.get('stores', 0)}")
+        print(f"Evicted   : {stats.get('evictions', 0)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
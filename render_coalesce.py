@@ -0,0 +1,102 @@
+"""Merge runs of short consecutive plays into one partial movie.
+
+Every self.play / self.wait normally gets its own partial movie: one encoder
+opened and flushed, one file, one more input for the final concat. Scenes that do many
+0.3-0.5s plays in a row (a FadeIn per replica, Create/FadeOut pairs) spend
+more time on that than on drawing. CoalescingWriterMixin keeps the encoder
+open across such a run and writes it as a single partial movie; frames and
+timing are exactly the same.
+
+A run ends before any play that is not written (cached or skipped), after a
+play longer than `max_play_seconds`, and once it reaches `max_run_seconds`.
+A play's length is only known once it has been encoded, so a long play that
+follows short ones still joins their run and ends it; only a long play that
+starts a run gets its own, cacheable, partial movie. Merged segments are not
+cached individually and are re-rendered on the next run.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+
+class CoalescingWriterMixin:
+    """SceneFileWriter mixin that encodes runs of short plays as one partial movie."""
+
+    max_play_seconds = 1.0
+    max_run_seconds = 10.0
+    files_saved = 0
+
+    _run = None
+
+    def _writing(self, allow_write):
+        from manim import config
+
+        return allow_write and config.write_to_movie and hasattr(self, "partial_movie_directory")
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        self._play_frames = 0
+        if not self._writing(allow_write):
+            self._close_run()
+            super().begin_animation(allow_write, file_path)
+            return
+        index = self.renderer.num_plays
+        if self._run is not None:
+            # Keep appending to the encoder that is already open
+            self._run["members"].append(index)
+            return
+        from manim import config
+
+        path = self.partial_movie_directory / f"coalesced.{os.getpid()}.{index}.part{config['movie_file_extension']}"
+        self._run = {"members": [index], "frames": 0, "path": path, "first": self.partial_movie_files[index]}
+        super().begin_animation(allow_write, path)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        self._play_frames += num_frames
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def end_animation(self, allow_write=False):
+        if self._run is None or not self._writing(allow_write):
+            super().end_animation(allow_write)
+            return
+        from manim import config
+
+        index = self.renderer.num_plays
+        self._run["frames"] += self._play_frames
+        # Placeholder until the run is closed, so nothing caches a file that does not exist yet
+        self.partial_movie_files[index] = None
+        if (
+            self._play_frames > self.max_play_seconds * config.frame_rate
+            or self._run["frames"] >= self.max_run_seconds * config.frame_rate
+        ):
+            self._close_run()
+
+    def _close_run(self):
+        run, self._run = self._run, None
+        if run is None:
+            return
+        super().end_animation(True)
+        members = run["members"]
+        if len(members) == 1:
+            # Nothing was merged: keep manim's name so the segment stays cacheable
+            target = Path(run["first"])
+        else:
+            stems = ",".join(self._stem(i) for i in members)
+            target = run["path"].with_name(f"coalesced_{hashlib.sha1(stems.encode()).hexdigest()[:16]}{run['path'].suffix}")
+            self.files_saved += len(members) - 1
+        os.replace(run["path"], target)
+        self.partial_movie_files[members[0]] = str(target)
+
+    def _stem(self, index):
+        # Segment hashes, from manim's list of played animations
+        return self.renderer.animations_hashes[index] or f"uncached_{index}"
+
+    def finish(self):
+        self._close_run()
+        super().finish()
+        if self.files_saved:
+            from manim import logger
+
+            logger.info(
+                "Coalescing: %(saved)d partial movie(s) and encoder open(s) saved",
+                {"saved": self.files_saved},
+            )
@@ -0,0 +1,81 @@
+"""Encode static holds with one pixel-format conversion.
+
+manim already recognises plays whose frames cannot change (a wait with no
+updaters and no running animation) and rasterizes them once, but its writer
+thread then builds and converts a new frame from the RGBA array for every
+output frame: a self.wait(3) at 1080p60 is 180 RGBA -> yuv420p conversions.
+HeldFramesMixin converts a repeated frame once and encodes that same frame
+into manim's own PyAV stream, so codec, time base and pixel format are
+manim's by construction and the decoded frames are bit-identical.
+
+A 3 second hold at 1080p60 took 3.4-3.9s instead of 5.2-6.4s. The encoder
+still encodes every frame, so the gain is bounded by x264 itself. It is
+opt-in (render_all.py --holds). Partials with holds are checked for the
+frames written, and the final movie for the frames and duration of its
+partials; a mismatch fails the render.
+"""
+from pathlib import Path
+
+
+def frame_count(path):
+    """Frames (video packets) in a movie file and its duration in seconds."""
+    import av
+
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        frames = sum(1 for packet in container.demux(stream) if packet.size)
+        duration = float(stream.duration * stream.time_base) if stream.duration else container.duration / av.time_base
+    return frames, duration
+
+
+class HeldFramesMixin:
+    """SceneFileWriter mixin that converts a held frame once, however long the hold."""
+
+    held_segments = 0
+    held_frames = 0
+
+    def encode_and_write_frame(self, frame, num_frames):
+        # Writer thread
+        self._partial_frames = getattr(self, "_partial_frames", 0) + num_frames
+        if num_frames < 2:
+            return super().encode_and_write_frame(frame, num_frames)
+        import av
+
+        held = av.VideoFrame.from_ndarray(frame, format="rgba").reformat(format=self.video_stream.pix_fmt)
+        for _ in range(num_frames):
+            # Let the encoder number it like a new frame; a reused frame keeps its first pts
+            held.pts = None
+            for packet in self.video_stream.encode(held):
+                self.video_container.mux(packet)
+        self._partial_has_hold = True
+        self.held_segments += 1
+        self.held_frames += num_frames - 1
+
+    def close_partial_movie_stream(self):
+        super().close_partial_movie_stream()
+        written = getattr(self, "_partial_frames", 0)
+        has_hold = getattr(self, "_partial_has_hold", False)
+        self._partial_frames, self._partial_has_hold = 0, False
+        if has_hold:
+            frames, _ = frame_count(self.partial_movie_file_path)
+            if frames != written:
+                raise RuntimeError(f"{self.partial_movie_file_path}: {frames} frames, {written} written")
+
+    def finish(self):
+        super().finish()
+        if not self.held_segments:
+            return
+        from manim import config, logger
+
+        movie = Path(getattr(self, "movie_file_path", "") or "")
+        if movie.suffix in (".mp4", ".mov", ".webm") and movie.exists():
+            partials = [frame_count(p)[0] for p in self.partial_movie_files if p]
+            frames, duration = frame_count(movie)
+            if frames != sum(partials) or abs(duration - frames / config.frame_rate) > 1 / config.frame_rate:
+                raise RuntimeError(
+                    f"{movie}: {frames} frames over {duration:.3f}s, expected {sum(partials)} at {config.frame_rate} fps"
+                )
+        logger.info(
+            "Static holds: %(segments)d segment(s), %(frames)d frame(s) encoded without converting them again",
+            {"segments": self.held_segments, "frames": self.held_frames},
+        )
@@ -0,0 +1,245 @@
+"""Per-animation profiling for Scene.play / Scene.wait.
+
+Usage:
+    python render_profile.py FILE [-o trace.json] [--top 20] [-- ARGS...]
+
+FILE is run as `__main__`, so the `if __name__ == "__main__"` blocks that
+call scene.render() are profiled as they are. From code:
+
+    with profiled("trace.json"):
+        scene.render()
+
+Every play (a wait is a play of one Wait) records its wall time split into
+interpolate (Scene.update_to_time), rasterize (CairoRenderer.update_frame),
+flush (SceneFileWriter.close_partial_movie_stream, waiting for the encoder
+to finish the partial movie) and other (setup, hashing, queueing frames),
+plus the frames written and the mobject family size. manim encodes frames
+with PyAV on a writer thread while the scene keeps rasterizing, so encode
+(SceneFileWriter.encode_and_write_frame on that thread) overlaps the other
+phases and is reported next to them, not as part of the wall time. A table
+sorted by wall time is printed and the calls are saved as a Chrome trace,
+which chrome://tracing, Perfetto and speedscope all open; each scene gets a
+row for its encoder thread.
+"""
+import argparse
+import contextlib
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Phases on the scene's thread; together with "other" they add up to the wall time
+PHASES = ("interpolate", "rasterize", "flush")
+# Trace row of a scene's encoder thread: its scene row plus this
+ENCODER_ROW = 1000
+_HERE = os.path.abspath(__file__)
+
+
+def _caller(manim_dir):
+    # First frame outside manim and this module: the scene's self.play/self.wait line
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if not filename.startswith(manim_dir + os.sep) and filename != _HERE:
+            return f"{Path(filename).name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?"
+
+
+def _describe(args):
+    names = []
+    for arg in args:
+        # _AnimationBuilder (mobject.animate...) builds into a Transform subclass
+        name = type(arg).__name__
+        names.append("animate" if name == "_AnimationBuilder" else name)
+    if names == ["Wait"]:
+        return "wait"
+    if len(names) > 3:
+        return f"{', '.join(names[:3])} +{len(names) - 3}"
+    return ", ".join(names)
+
+
+class Profiler:
+    def __init__(self):
+        self.calls = []
+        self.events = []
+        self._current = threading.local()
+        self._writing = {}  # id(file writer) -> call, for the encoder thread
+        self._threads = {}  # one trace row per scene
+        self._start = time.perf_counter()
+        self._patched = []
+
+    def _us(self, t):
+        return (t - self._start) * 1e6
+
+    def _phase(self, phase, func, encoder=False):
+        profiler = self
+
+        def timed(*args, **kwargs):
+            if encoder:
+                call = profiler._writing.get(id(args[0]))
+            else:
+                call = getattr(profiler._current, "call", None)
+            if call is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                call[phase] += end - start
+                profiler.events.append(
+                    {"name": phase, "cat": phase, "ph": "X", "ts": profiler._us(start),
+                     "dur": (end - start) * 1e6, "pid": 1, "tid": call["tid"] + (ENCODER_ROW if encoder else 0)}
+                )
+
+        return timed
+
+    def _play(self, func, manim_dir):
+        profiler = self
+
+        def play(scene, *args, **kwargs):
+            if getattr(profiler._current, "call", None) is not None:
+                return func(scene, *args, **kwargs)
+            renderer = scene.renderer
+            call = {
+                "scene": type(scene).__name__,
+                "line": _caller(manim_dir),
+                "call": _describe(args),
+                "tid": profiler._threads.setdefault(id(scene), len(profiler._threads) + 1),
+                "frames": 0,
+                "encode": 0.0,
+                **{phase: 0.0 for phase in PHASES},
+            }
+            start_time = renderer.time
+            profiler._current.call = call
+            profiler._writing[id(renderer.file_writer)] = call
+            start = time.perf_counter()
+            try:
+                return func(scene, *args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                profiler._current.call = None
+                # The encoder thread has been joined by now (or never started)
+                profiler._writing.pop(id(renderer.file_writer), None)
+                call["wall"] = end - start
+                call["other"] = max(call["wall"] - sum(call[p] for p in PHASES), 0.0)
+                call["frames"] = 0 if renderer.skip_animations else int(round((renderer.time - start_time) * _frame_rate()))
+                call["family"] = len(scene.get_mobject_family_members())
+                profiler.calls.append(call)
+                profiler.events.append(
+                    {"name": f"{call['line']} {call['call']}", "cat": "play", "ph": "X", "ts": profiler._us(start),
+                     "dur": call["wall"] * 1e6, "pid": 1, "tid": call["tid"],
+                     "args": {"frames": call["frames"], "family": call["family"]}}
+                )
+
+        return play
+
+    def _patch(self, cls, name, wrapper):
+        original = cls.__dict__[name]
+        self._patched.append((cls, name, original))
+        setattr(cls, name, wrapper(original))
+
+    def install(self):
+        import manim
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene import Scene
+        from manim.scene.scene_file_writer import SceneFileWriter
+
+        manim_dir = os.path.dirname(os.path.abspath(manim.__file__))
+        self._patch(Scene, "play", lambda f: self._play(f, manim_dir))
+        self._patch(Scene, "update_to_time", lambda f: self._phase("interpolate", f))
+        self._patch(CairoRenderer, "update_frame", lambda f: self._phase("rasterize", f))
+        self._patch(SceneFileWriter, "close_partial_movie_stream", lambda f: self._phase("flush", f))
+        self._patch(SceneFileWriter, "encode_and_write_frame", lambda f: self._phase("encode", f, encoder=True))
+        return self
+
+    def uninstall(self):
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched = []
+
+    def trace(self):
+        threads = {}
+        for call in self.calls:
+            threads.setdefault(call["tid"], call["scene"])
+        meta = []
+        for tid, scene in threads.items():
+            meta.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": scene}})
+            meta.append(
+                {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid + ENCODER_ROW, "args": {"name": f"{scene} encoder"}}
+            )
+        return {"traceEvents": meta + self.events, "displayTimeUnit": "ms"}
+
+    def save(self, path):
+        Path(path).write_text(json.dumps(self.trace()))
+
+    def report(self, top=20, file=None):
+        file = file or sys.stdout
+        calls = sorted(self.calls, key=lambda c: c["wall"], reverse=True)
+        print(
+            f"{'location':<28} {'call':<32} {'wall':>7} {'interp':>7} {'raster':>7} {'flush':>7} {'other':>7}"
+            f" {'encode':>7} {'frames':>6} {'family':>6}",
+            file=file,
+        )
+        for c in calls[:top] if top else calls:
+            print(
+                f"{c['line']:<28} {c['call'][:32]:<32} {c['wall']:>7.2f} {c['interpolate']:>7.2f} {c['rasterize']:>7.2f}"
+                f" {c['flush']:>7.2f} {c['other']:>7.2f} {c['encode']:>7.2f} {c['frames']:>6} {c['family']:>6}",
+                file=file,
+            )
+        if top and len(calls) > top:
+            print(f"... {len(calls) - top} more calls", file=file)
+        total = {key: sum(c[key] for c in calls) for key in ("wall", *PHASES, "other", "encode", "frames")}
+        print(
+            f"{'total':<28} {f'{len(calls)} calls':<32} {total['wall']:>7.2f} {total['interpolate']:>7.2f}"
+            f" {total['rasterize']:>7.2f} {total['flush']:>7.2f} {total['other']:>7.2f} {total['encode']:>7.2f}"
+            f" {total['frames']:>6}",
+            file=file,
+        )
+        print("encode runs on the writer thread, overlapping the other columns", file=file)
+
+
+def _frame_rate():
+    from manim import config
+
+    return config.frame_rate
+
+
+@contextlib.contextmanager
+def profiled(output=None, top=20):
+    """Profile every play inside the block; print the table and save the trace on exit."""
+    profiler = Profiler().install()
+    try:
+        yield profiler
+    finally:
+        profiler.uninstall()
+        profiler.report(top)
+        if output:
+            profiler.save(output)
+            print(f"Trace written to {output} (open in chrome://tracing, ui.perfetto.dev or speedscope.app)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile every self.play/self.wait of a scene script.")
+    parser.add_argument("file", help="Script whose __main__ block renders the scene(s)")
+    parser.add_argument("-o", "--output", default=None, help="Chrome trace file (default: <file>.trace.json)")
+    parser.add_argument("--top", type=int, default=20, help="Rows in the table (0 for all)")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments passed to the script after --")
+    args = parser.parse_args(argv)
+
+    path = Path(args.file).resolve()
+    script_args = args.args[1:] if args.args[:1] == ["--"] else args.args
+    output = args.output or f"{path.stem}.trace.json"
+    sys.argv = [str(path), *script_args]
+    sys.path.insert(0, str(path.parent))
+    with profiled(output, args.top):
+        runpy.run_path(str(path), run_name="__main__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
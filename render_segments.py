@@ -0,0 +1,171 @@
+"""Render the play/wait segments of one scene in parallel.
+
+Usage:
+    python render_segments.py FILE [-s SCENE] [-q l|m|h|p|k] [-j JOBS]
+
+1. Plan: run construct() once with every animation skipped to count the
+   segments and their frames. Skipped segments write no frames, but manim
+   still rasterizes each one's static background, and a frozen wait once.
+2. Split them into contiguous chunks of about equal cost.
+3. Each worker replays construct() with manim's from/upto_animation_number,
+   skipping the segments before its chunk in the same way, so the state at
+   its first segment is the serial state, and writes the chunk's partial
+   movies under their usual content hashes.
+4. A normal render in this process then finds every segment already on
+   disk and lets manim concatenate them, exactly as a serial render would.
+   Any segment whose hash does not match (e.g. a scene driven by
+   time-integrating updaters) is simply rendered there, serially.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_all import QUALITIES, discover_scenes, load_scene_class, render_scene
+
+# Relative cost of a frozen wait frame: it is rasterized once and repeated
+WAIT_FRAME_COST = 0.1
+
+
+class ChunkFileWriterMixin:
+    """Write partial movies atomically and leave concatenation to the final pass."""
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        index = self.renderer.num_plays
+        self._chunk_target = None
+        if allow_write and index < len(self.partial_movie_files) and self.partial_movie_files[index]:
+            # Two chunks can render identical segments (same hash); never let
+            # them write the same file at once
+            target = Path(self.partial_movie_files[index])
+            self._chunk_target = target
+            self.partial_movie_files[index] = str(target.with_name(f"{target.stem}.{os.getpid()}.part{target.suffix}"))
+        super().begin_animation(allow_write, file_path)
+
+    def end_animation(self, allow_write=False):
+        super().end_animation(allow_write)
+        if self._chunk_target is not None:
+            index = self.renderer.num_plays
+            os.replace(self.partial_movie_files[index], self._chunk_target)
+            self.partial_movie_files[index] = str(self._chunk_target)
+
+    def finish(self):
+        pass
+
+
+def plan(path, scene_name, quality="l", media_dir="media"):
+    """Return the estimated cost (in frames) of every play/wait segment."""
+    from manim import Wait, config, tempconfig
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    class PlanningRenderer(CairoRenderer):
+        def play(self, scene, *args, **kwargs):
+            super().play(scene, *args, **kwargs)
+            frames = max(1, round(scene.duration * config.frame_rate))
+            if all(isinstance(a, Wait) for a in scene.animations):
+                frames *= WAIT_FRAME_COST
+            self.costs.append(frames)
+
+    settings = {
+        "quality": QUALITIES[quality],
+        "media_dir": str(media_dir),
+        "input_file": str(Path(path).resolve()),
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "preview": False,
+    }
+    with tempconfig(settings):
+        renderer = PlanningRenderer(skip_animations=True)
+        renderer.costs = []
+        load_scene_class(path, scene_name)(renderer=renderer).render()
+    return renderer.costs
+
+
+def split(costs, parts):
+    """Cut segment indices into at most `parts` contiguous (first, last) chunks of similar cost."""
+    parts = max(1, min(parts, len(costs)))
+    target = sum(costs) / parts
+    chunks, first, total = [], 0, 0.0
+    for index, cost in enumerate(costs):
+        total += cost
+        if len(chunks) < parts - 1 and total >= target * (len(chunks) + 1):
+            chunks.append((first, index))
+            first = index + 1
+    if first < len(costs):
+        chunks.append((first, len(costs) - 1))
+    return chunks
+
+
+def render_parallel(path, scene_name, quality="l", media_dir="media", jobs=None, cache_dir=None, cache_size=None):
+    from manim import config
+
+    if config.disable_caching:
+        raise RuntimeError("segment-parallel rendering relies on manim's segment hashes; enable caching")
+
+    start = time.perf_counter()
+    costs = plan(path, scene_name, quality, media_dir)
+    chunks = split(costs, jobs or os.cpu_count() or 1)
+    if not chunks:
+        # Nothing plays or waits: there is nothing to split
+        return render_scene(path, scene_name, quality, media_dir, cache_dir, cache_size)
+    print(f"{len(costs)} segments in {len(chunks)} chunk(s), planned in {time.perf_counter() - start:.1f}s", flush=True)
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        futures = [
+            pool.submit(
+                render_scene,
+                path,
+                scene_name,
+                quality,
+                media_dir,
+                cache_dir,
+                cache_size,
+                {"from_animation_number": first, "upto_animation_number": last},
+                (ChunkFileWriterMixin,),
+            )
+            for first, last in chunks
+        ]
+        for (first, last), future in zip(chunks, futures):
+            result = future.result()
+            if not result["ok"]:
+                return result
+            print(f"  segments {first:>4}-{last:<4} {result['seconds']:7.1f}s", flush=True)
+
+    # Every segment is on disk now: this pass only hashes, finds them and concatenates
+    result = render_scene(path, scene_name, quality, media_dir, cache_dir, cache_size)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render one scene's segments in parallel.")
+    parser.add_argument("file")
+    parser.add_argument("-s", "--scene", default="*")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--cache-size", default=None)
+    parser.add_argument("--no-cache", action="store_true", help="Do not use the persistent render cache")
+    args = parser.parse_args(argv)
+
+    cache_dir = None
+    if not args.no_cache:
+        from render_cache import DEFAULT_DIR
+
+        cache_dir = args.cache_dir or DEFAULT_DIR
+
+    status = 0
+    for path, name, _ in discover_scenes([args.file], args.scene):
+        result = render_parallel(path, name, args.quality, args.media_dir, args.jobs, cache_dir, args.cache_size)
+        ok = " ok " if result["ok"] else "FAIL"
+        print(f"[{ok}] {result['file']}:{result['scene']}  {result['seconds']:.1f}s  {result.get('output', '')}")
+        if not result["ok"]:
+            print(result["error"], file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
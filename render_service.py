@@ -0,0 +1,360 @@
+"""Local render service: parameterized scenes on demand.
+
+Usage:
+    python render_service.py [--port 8765 | --socket PATH] [-j JOBS] [--max-queue 64]
+
+Jobs are JSON requests naming a scene and its parameters, e.g.
+
+    curl -s localhost:8765/jobs -d '{"scene": "TwoSumScene", "params": {"nums": [3, 2, 4], "target": 6}}'
+
+They are queued onto a bounded process pool. manim is imported once per
+worker, while the project's own modules are re-imported for every job so an
+edited scene never renders stale code. A job's id is the hash of its scene,
+parameters, quality and the source of the scene module and the project
+modules it imports, so an identical request is answered from the result
+folder or attached to the job already rendering it. Everything is served from local disk.
+
+    POST /jobs              {"scene", "params", "quality"} -> job
+    GET  /jobs/<id>         job status
+    GET  /jobs/<id>/video   the rendered movie
+    GET  /scenes            scenes and the parameters they accept
+    GET  /metrics           counters, queue depth and latencies
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from render_all import PROJECT_DIR, QUALITIES, _warm_up, discover_scenes, render_scene
+from render_watch import watched_files
+
+DEFAULT_DIR = PROJECT_DIR / "media" / "service"
+# Constructor parameters of the parameterized scenes; every other scene takes none
+PARAMETERS = {
+    "two_sum_visual:TwoSumScene": {"nums": list, "target": int},
+    "consistent_hashing_visual:ConsistentHashingScene": {
+        "nodes": list, "num_replicas": int, "keys": list, "node_to_remove": str,
+    },
+    "transformers:TransformerArchitecture": {"tokens": list},
+}
+
+
+class JobError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class RenderService:
+    def __init__(self, root=DEFAULT_DIR, jobs=None, max_queue=64, cache_dir=None):
+        self.root = Path(root)
+        self.results = self.root / "results"
+        self.results.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_queue = max_queue
+        self.workers = jobs or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up)
+        self.scenes = {f"{path.stem}:{name}": path for path, name, _ in discover_scenes()}
+        self.jobs = {}
+        self.futures = {}
+        self.lock = threading.Lock()
+        self.counts = {"submitted": 0, "deduplicated": 0, "cache_hits": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self.render_seconds = []
+        self.queue_seconds = []
+
+    def resolve(self, scene):
+        # "file:Scene", or a bare name when it is unique (or parameterized)
+        if scene in self.scenes:
+            return scene
+        matches = [q for q in self.scenes if q.split(":")[1] == scene]
+        if len(matches) > 1:
+            matches = [q for q in matches if q in PARAMETERS] or matches
+        if not matches:
+            raise JobError(404, f"unknown scene {scene!r}")
+        if len(matches) > 1:
+            raise JobError(400, f"{scene} is ambiguous, use one of {', '.join(matches)}")
+        return matches[0]
+
+    def job_key(self, scene, params, quality):
+        path = self.scenes[scene]
+        digest = hashlib.sha256(json.dumps([scene, params, quality], sort_keys=True).encode())
+        for source in watched_files(path):
+            digest.update(source.read_bytes())
+        return digest.hexdigest()[:24]
+
+    def validate(self, request):
+        if not isinstance(request, dict):
+            raise JobError(400, "request must be a JSON object")
+        if not isinstance(request.get("scene"), str):
+            raise JobError(400, "request needs a scene name")
+        scene = self.resolve(request["scene"])
+        quality = request.get("quality", "l")
+        if not isinstance(quality, str) or quality not in QUALITIES:
+            raise JobError(400, f"quality must be one of {', '.join(sorted(QUALITIES))}")
+        params = request.get("params", {})
+        if not isinstance(params, dict):
+            raise JobError(400, "params must be a JSON object")
+        allowed = PARAMETERS.get(scene, {})
+        for name, value in params.items():
+            if name not in allowed:
+                raise JobError(400, f"{scene} has no parameter {name!r}")
+            if not isinstance(value, allowed[name]) or isinstance(value, bool):
+                raise JobError(400, f"{name} must be a {allowed[name].__name__}")
+        return scene, params, quality
+
+    def _result(self, key):
+        meta = self.results / f"{key}.json"
+        if meta.exists():
+            return json.loads(meta.read_text())
+        return None
+
+    def submit(self, request):
+        scene, params, quality = self.validate(request)
+        key = self.job_key(scene, params, quality)
+        with self.lock:
+            self.counts["submitted"] += 1
+            job = self.jobs.get(key)
+            if job is not None and job["status"] in ("queued", "running", "done"):
+                self.counts["deduplicated"] += 1
+                return dict(job, deduplicated=True)
+            result = self._result(key)
+            if result is not None:
+                self.counts["cache_hits"] += 1
+                self.jobs[key] = dict(result, cached=True)
+                return self.jobs[key]
+            if self.pending() >= self.max_queue:
+                self.counts["rejected"] += 1
+                raise JobError(503, "queue is full, retry later")
+            job = {"id": key, "scene": scene, "params": params, "quality": quality, "status": "queued", "submitted": time.time()}
+            self.jobs[key] = job
+            future = self.pool.submit(
+                _render_job, str(self.scenes[scene]), scene.split(":")[1], params, quality, str(self.root), key, self.cache_dir
+            )
+            self.futures[key] = future
+        # Outside the lock: the callback runs right away if the job already finished
+        future.add_done_callback(lambda f: self._finished(key, f))
+        return dict(job)
+
+    def _finished(self, key, future):
+        try:
+            result = future.result()
+        except Exception as e:  # the worker process died
+            result = {"ok": False, "error": repr(e)}
+        with self.lock:
+            job = self.jobs[key]
+            self.futures.pop(key, None)
+            if result.get("started"):
+                self.queue_seconds.append(result["started"] - job["submitted"])
+            if result["ok"]:
+                job.update(status="done", seconds=result["seconds"], video=f"/jobs/{key}/video")
+                self.counts["completed"] += 1
+                self.render_seconds.append(result["seconds"])
+                (self.results / f"{key}.json").write_text(json.dumps(job))
+            else:
+                job.update(status="failed", error=result["error"])
+                self.counts["failed"] += 1
+
+    def _refresh(self):
+        # Futures are marked running once a worker has taken them
+        for key, future in self.futures.items():
+            if future.running() and self.jobs[key]["status"] == "queued":
+                self.jobs[key]["status"] = "running"
+
+    def status(self, key):
+        with self.lock:
+            self._refresh()
+            job = self.jobs.get(key)
+            if job is not None:
+                return dict(job)
+        result = self._result(key)
+        if result is None:
+            raise JobError(404, f"no job {key}")
+        return result
+
+    def video(self, key):
+        path = self.results / f"{key}.mp4"
+        if not path.exists():
+            raise JobError(404, f"job {key} has no video (yet)")
+        return path
+
+    def pending(self):
+        return sum(1 for job in self.jobs.values() if job["status"] in ("queued", "running"))
+
+    def metrics(self):
+        with self.lock:
+            self._refresh()
+            states = [job["status"] for job in self.jobs.values()]
+            return {
+                **self.counts,
+                "queued": states.count("queued"),
+                "running": states.count("running"),
+                "workers": self.workers,
+                "render_seconds": {
+                    "p50": _percentile(self.render_seconds, 0.5),
+                    "p95": _percentile(self.render_seconds, 0.95),
+                    "max": max(self.render_seconds, default=None),
+                },
+                "queue_seconds": {
+                    "p50": _percentile(self.queue_seconds, 0.5),
+                    "p95": _percentile(self.queue_seconds, 0.95),
+                    "max": max(self.queue_seconds, default=None),
+                },
+            }
+
+    def describe_scenes(self):
+        return {
+            name: {p: t.__name__ for p, t in PARAMETERS.get(name, {}).items()}
+            for name, path in sorted(self.scenes.items())
+        }
+
+
+def _forget_project_modules():
+    # Workers outlive edits to the scene files; drop every module loaded from
+    # the project so the job runs the source its key was computed from
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if name != "__main__" and file and Path(file).resolve().parent == PROJECT_DIR:
+            del sys.modules[name]
+
+
+def _render_job(path, scene, params, quality, root, key, cache_dir):
+    # Pool worker: render into a private media folder, keep only the movie
+    started = time.time()
+    _forget_project_modules()
+    media_dir = Path(root) / "jobs" / key
+    result = render_scene(
+        path,
+        scene,
+        quality,
+        media_dir,
+        cache_dir,
+        config_overrides={"progress_bar": "none"},
+        scene_kwargs=params,
+    )
+    if result["ok"]:
+        shutil.move(result["output"], Path(root) / "results" / f"{key}.mp4")
+    shutil.rmtree(media_dir, ignore_errors=True)
+    result["started"] = started
+    return result
+
+
+class Handler(BaseHTTPRequestHandler):
+    service = None
+
+    def _send(self, status, body):
+        data = json.dumps(body, indent=2).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self, action):
+        try:
+            action()
+        except JobError as e:
+            self._send(e.status, {"error": str(e)})
+
+    def do_GET(self):
+        parts = [p for p in self.path.split("?")[0].split("/") if p]
+
+        def action():
+            if parts == ["scenes"]:
+                self._send(200, self.service.describe_scenes())
+            elif parts == ["metrics"]:
+                self._send(200, self.service.metrics())
+            elif len(parts) == 2 and parts[0] == "jobs":
+                self._send(200, self.service.status(parts[1]))
+            elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "video":
+                path = self.service.video(parts[1])
+                self.send_response(200)
+                self.send_header("Content-Type", "video/mp4")
+                self.send_header("Content-Length", str(path.stat().st_size))
+                self.end_headers()
+                with path.open("rb") as f:
+                    shutil.copyfileobj(f, self.wfile)
+            else:
+                raise JobError(404, "not found")
+
+        self._handle(action)
+
+    def do_POST(self):
+        def action():
+            if self.path.rstrip("/") != "/jobs":
+                raise JobError(404, "not found")
+            try:
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            except json.JSONDecodeError as e:
+                raise JobError(400, f"invalid JSON: {e}")
+            job = self.service.submit(request)
+            self._send(200 if job["status"] == "done" else 202, job)
+
+        self._handle(action)
+
+    def log_message(self, format, *args):
+        # Unix socket clients have no address
+        sys.stderr.write(f"{self.log_date_time_string()} {format % args}\n")
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve parameterized scene renders over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", default=None, help="Listen on a Unix socket instead of TCP")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-queue", type=int, default=64, help="Pending jobs accepted before answering 503")
+    parser.add_argument("--dir", default=str(DEFAULT_DIR), help="Where results are kept")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--no-cache", action="store_true", help="Do not use the persistent render cache")
+    args = parser.parse_args(argv)
+
+    cache_dir = None
+    if not args.no_cache:
+        from render_cache import DEFAULT_DIR as CACHE_DIR
+
+        cache_dir = args.cache_dir or str(CACHE_DIR)
+    Handler.service = RenderService(args.dir, args.jobs, args.max_queue, cache_dir)
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        server = UnixHTTPServer(args.socket, Handler)
+        where = args.socket
+    else:
+        server = ThreadingHTTPServer((args.host, args.port), Handler)
+        where = f"http://{args.host}:{args.port}"
+    print(f"Render service on {where} ({Handler.service.workers} workers)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        Handler.service.pool.shutdown(cancel_futures=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
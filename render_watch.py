@@ -0,0 +1,199 @@
+"""Hot-reload preview: re-render a scene whenever its source changes.
+
+Usage:
+    python render_watch.py FILE [-s SCENE] [-q l] [--interval 0.2]
+
+manim is preloaded once (as in render_worker.py) and every render runs in a
+forked child. On each save the construct() body is split into segments, one
+per statement that plays or waits, and compared with the previous version
+to report which segments changed. Only those are rasterized again: every
+unchanged play hashes to a partial movie that is already on disk (or in the
+render cache), and the preview is rebuilt by concatenating them.
+"""
+import argparse
+import ast
+import difflib
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+
+from render_all import PROJECT_DIR, QUALITIES, discover_scenes, render_scene
+from render_worker import preload
+
+
+def _renders(stmt):
+    return any(
+        isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in ("play", "wait")
+        for node in ast.walk(stmt)
+    )
+
+
+def _fingerprint(nodes):
+    # ast.dump leaves out line numbers, so moving code around is not a change
+    return hashlib.sha1("\n".join(ast.dump(n) for n in nodes).encode()).hexdigest()
+
+
+def construct_segments(source, scene_name):
+    """Split `scene_name.construct` into segments.
+
+    Returns (segments, context): a list of (first_line, last_line, fingerprint)
+    and a fingerprint of everything else in the module.
+    """
+    tree = ast.parse(source)
+    construct = None
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == scene_name:
+            construct = next((f for f in node.body if isinstance(f, ast.FunctionDef) and f.name == "construct"), None)
+    if construct is None:
+        return [], _fingerprint([tree])
+
+    segments, current = [], []
+    for stmt in construct.body:
+        current.append(stmt)
+        if _renders(stmt):
+            segments.append(current)
+            current = []
+    if current:
+        segments.append(current)
+
+    body = construct.body
+    construct.body = []
+    context = _fingerprint([tree])
+    construct.body = body
+    return [(s[0].lineno, s[-1].end_lineno, _fingerprint(s)) for s in segments], context
+
+
+def describe_changes(old, new):
+    """Human readable list of segments in `new` that differ from `old`."""
+    matcher = difflib.SequenceMatcher(None, [s[2] for s in old], [s[2] for s in new], autojunk=False)
+    changes = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag in ("replace", "insert"):
+            for j in range(j1, j2):
+                changes.append(f"segment {j} (lines {new[j][0]}-{new[j][1]})")
+        elif tag == "delete":
+            changes.append(f"{i2 - i1} segment(s) removed before segment {j1}")
+    return changes
+
+
+def watched_files(path):
+    # The scene module plus any project module it imports
+    files = [Path(path).resolve()]
+    for node in ast.walk(ast.parse(files[0].read_text())):
+        names = []
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        for name in names:
+            candidate = PROJECT_DIR / f"{name.split('.')[0]}.py"
+            if candidate.exists() and candidate not in files:
+                files.append(candidate)
+    return files
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0  # missing, e.g. between an editor's write and rename
+
+
+def _mtimes(files):
+    return tuple(_mtime(f) for f in files)
+
+
+def _render_in_child(path, scene_name, quality, media_dir, cache_dir):
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            result = render_scene(
+                path, scene_name, quality, media_dir, cache_dir, config_overrides={"progress_bar": "none"}
+            )
+            if result["ok"]:
+                print(f"  {scene_name}: {result['seconds']:.2f}s -> {result['output']}", flush=True)
+                status = 0
+            else:
+                print(result["error"], file=sys.stderr, flush=True)
+        finally:
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    return status == 0
+
+
+def watch(path, scene_pattern="*", quality="l", media_dir="media", cache_dir=None, interval=0.2):
+    path = Path(path).resolve()
+    preload()
+    print(f"Watching {path.name} (Ctrl+C to stop)", flush=True)
+    previous = {}
+    seen_mtimes = None
+    files = [path]
+    while True:
+        try:
+            files = watched_files(path)
+        except (SyntaxError, OSError):
+            pass  # half-written save: keep the previous file list, reported below
+        mtimes = _mtimes(files)
+        if mtimes != seen_mtimes:
+            seen_mtimes = mtimes
+            start = time.perf_counter()
+            try:
+                source = path.read_text()
+                scenes = [name for _, name, _ in discover_scenes([path], scene_pattern)]
+                parsed = {name: construct_segments(source, name) for name in scenes}
+            except SyntaxError as e:
+                print(f"Syntax error, waiting for the next save: {e}", flush=True)
+                time.sleep(interval)
+                continue
+            except OSError:
+                # Atomic save (temp file + rename) caught mid-way: fingerprint again on the next poll
+                seen_mtimes = None
+                time.sleep(interval)
+                continue
+            for name in scenes:
+                segments, context = parsed[name]
+                if name in previous:
+                    old_segments, old_context = previous[name]
+                    if context != old_context:
+                        print(f"{name}: code outside construct() changed, every segment may be affected", flush=True)
+                    changes = describe_changes(old_segments, segments)
+                    if not changes and context == old_context:
+                        print(f"{name}: no construct() changes", flush=True)
+                    for change in changes:
+                        print(f"{name}: changed {change}", flush=True)
+                else:
+                    print(f"{name}: {len(segments)} segments", flush=True)
+                _render_in_child(path, name, quality, media_dir, cache_dir)
+                previous[name] = (segments, context)
+            print(f"Preview rebuilt in {time.perf_counter() - start:.2f}s", flush=True)
+        time.sleep(interval)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-render a scene on every save.")
+    parser.add_argument("file")
+    parser.add_argument("-s", "--scene", default="*")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("--interval", type=float, default=0.2, help="Polling interval in seconds")
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--no-cache", action="store_true", help="Do not use the persistent render cache")
+    args = parser.parse_args(argv)
+
+    cache_dir = None
+    if not args.no_cache:
+        from render_cache import DEFAULT_DIR
+
+        cache_dir = args.cache_dir or DEFAULT_DIR
+    try:
+        watch(args.file, args.scene, args.quality, args.media_dir, cache_dir, args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Long-lived render worker with manim, Cairo and fonts preloaded.
+
+    python render_worker.py serve                      # start the worker
+    python render_worker.py submit FILE -s SCENE -q l  # send it a job
+
+The worker imports manim once, lays out a Text and rasterizes a frame so font
+discovery and Cairo setup are done up front, then forks a child per job. The
+child inherits the warm interpreter, renders the scene, and streams its log
+and a final status line back over a Unix socket.
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import traceback
+
+from render_all import QUALITIES, discover_scenes, render_scene
+
+DEFAULT_SOCKET = os.environ.get("RENDER_WORKER_SOCKET", "/tmp/manim-render-worker.sock")
+RESULT_PREFIX = "RESULT "
+
+
+def preload():
+    from manim import Camera, Circle, Text, tempconfig
+
+    with tempfile.TemporaryDirectory() as media_dir:
+        with tempconfig({"media_dir": media_dir, "quality": QUALITIES["l"]}):
+            text = Text("warm up", font_size=24)
+            camera = Camera()
+            camera.capture_mobjects([Circle(), text])
+
+
+def _run_job(conn, request):
+    # Child process: send everything manim prints back to the client
+    os.dup2(conn.fileno(), 1)
+    os.dup2(conn.fileno(), 2)
+    writer_mixins = ()
+    if request.get("coalesce"):
+        from render_coalesce import CoalescingWriterMixin
+
+        writer_mixins = (CoalescingWriterMixin,)
+    results = []
+    for path, name, _ in discover_scenes([request["file"]], request.get("scene", "*")):
+        results.append(
+            render_scene(
+                path,
+                name,
+                request.get("quality", "l"),
+                request.get("media_dir", "media"),
+                request.get("cache_dir"),
+                request.get("cache_size"),
+                writer_mixins=writer_mixins,
+            )
+        )
+    _send_results(conn, results)
+
+
+def _send_results(conn, results):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    conn.sendall((RESULT_PREFIX + json.dumps(results) + "\n").encode())
+
+
+def _child(conn):
+    # Anything that fails outside render_scene (bad request, missing file,
+    # unparsable module) is reported as a failed result, not a silent exit
+    request = {}
+    try:
+        # Read here, not in the server, so a slow client only holds up its own child
+        with conn.makefile("r") as stream:
+            request = json.loads(stream.readline())
+        _run_job(conn, request)
+    except Exception:
+        job = request if isinstance(request, dict) else {}
+        failure = {
+            "file": os.path.basename(str(job.get("file", "?"))),
+            "scene": job.get("scene", "*"),
+            "ok": False,
+            "seconds": 0.0,
+            "error": traceback.format_exc(),
+        }
+        _send_results(conn, [failure])
+
+
+def serve(socket_path=DEFAULT_SOCKET):
+    preload()
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    # Children are never waited on explicitly
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(f"Render worker ready on {socket_path} (pid {os.getpid()})", flush=True)
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                if os.fork() == 0:
+                    server.close()
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    try:
+                        _child(conn)
+                    finally:
+                        os._exit(0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        os.unlink(socket_path)
+
+
+def submit(request, socket_path=DEFAULT_SOCKET):
+    """Send a job to the worker, echo its output and return the results."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(socket_path)
+    client.sendall((json.dumps(request) + "\n").encode())
+    results = None
+    with client, client.makefile("r", errors="replace") as stream:
+        for line in stream:
+            if line.startswith(RESULT_PREFIX):
+                results = json.loads(line[len(RESULT_PREFIX):])
+            else:
+                sys.stdout.write(line)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm manim render worker.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="Preload manim and wait for jobs")
+    job = commands.add_parser("submit", help="Render a scene on the running worker")
+    job.add_argument("file")
+    job.add_argument("-s", "--scene", default="*")
+    job.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    job.add_argument("--media-dir", default="media")
+    job.add_argument("--cache-dir", default=None)
+    job.add_argument("--cache-size", default=None)
+    job.add_argument("--no-cache", action="store_true")
+    job.add_argument("--coalesce", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket)
+        return 0
+
+    if not os.path.exists(args.socket):
+        print(f"No render worker listening on {args.socket}; start one with 'make worker'.", file=sys.stderr)
+        return 1
+    cache_dir = None
+    if not args.no_cache:
+        from render_cache import DEFAULT_DIR
+
+        cache_dir = args.cache_dir or DEFAULT_DIR
+    request = {
+        "file": os.path.abspath(args.file),
+        "scene": args.scene,
+        "quality": args.quality,
+        "media_dir": args.media_dir,
+        "cache_dir": cache_dir,
+        "cache_size": args.cache_size,
+        "coalesce": args.coalesce,
+    }
+    results = submit(request, args.socket)
+    if not results:
+        print("No scenes rendered.", file=sys.stderr)
+        return 1
+    for result in results:
+        status = " ok " if result["ok"] else "FAIL"
+        print(f"[{status}] {result['file']}:{result['scene']}  {result['seconds']:.2f}s  {result.get('output', '')}")
+        if not result["ok"]:
+            print(result["error"], file=sys.stderr)
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Batched ring placement: thousands of vnodes or keys as one mobject.
+
+Positions for a whole array of 64-bit ring hashes come from one NumPy call,
+and the points are drawn as a single PMobject with per-point colors instead
+of a Dot (and a Text) per vnode, so a ring with 5,000 vnodes and 50,000 keys
+is two mobjects. Labels are only made for a sampled subset (lod_indices).
+"""
+import numpy as np
+from manim import BLUE, GOLD, GREEN, MAROON, ORANGE, ORIGIN, PINK, PURPLE, RED, TAU, TEAL, YELLOW, PMobject, color_to_rgba
+
+from hash_ring import RING_SIZE
+
+PALETTE = [RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE, TEAL, PINK, GOLD, MAROON]
+
+
+def ring_angles(hashes):
+    # Same projection as HashRing.angle, in radians
+    return np.asarray(hashes, dtype=np.uint64).astype(np.float64) * (TAU / RING_SIZE)
+
+
+def ring_points(hashes, radius=3, center=ORIGIN):
+    """(N, 3) points on a circle for an array of ring hashes."""
+    angles = ring_angles(hashes)
+    points = np.zeros((len(angles), 3))
+    points[:, 0] = np.cos(angles) * radius
+    points[:, 1] = np.sin(angles) * radius
+    return points + center
+
+
+def owner_rgbas(owners, palette=PALETTE, opacity=1.0):
+    """Per-point RGBA rows, one palette color per owner index."""
+    colors = np.array([color_to_rgba(color, opacity) for color in palette])
+    return colors[np.asarray(owners) % len(colors)]
+
+
+def ring_cloud(points, rgbas, stroke_width=4):
+    """A single point-cloud mobject drawing every point in its own color."""
+    cloud = PMobject(stroke_width=stroke_width)
+    cloud.add_points(points, rgbas=rgbas)
+    return cloud
+
+
+def lod_indices(count, max_labels):
+    # Evenly spaced over ring order, so the labels spread around the circle
+    if count <= max_labels:
+        return np.arange(count)
+    return np.linspace(0, count, max_labels, endpoint=False).astype(int)
@@ -0,0 +1,71 @@
+from manim import *
+import numpy as np
+
+from consistent_hashing_visual import ConsistentHashingVisualizer
+from ring_cloud import PALETTE, lod_indices, owner_rgbas, ring_cloud, ring_points
+from ring_simulator import key_hashes
+from text_cache import cached_text
+
+class LargeRingScene(Scene):
+    # 50 nodes x 100 replicas = 5,000 vnodes
+    num_nodes = 50
+    num_replicas = 100
+    num_keys = 50_000
+    # Only this many vnodes get a text label
+    max_labels = 12
+    radius = 3
+
+    def construct(self):
+        ch = ConsistentHashingVisualizer(num_replicas=self.num_replicas)
+        nodes = [f"node{i}" for i in range(self.num_nodes)]
+        ch.add_nodes(nodes)
+        keys = key_hashes(self.num_keys)
+
+        ring = Circle(radius=self.radius, color=WHITE, stroke_width=2)
+        title = cached_text(f"{len(ch.ring):,} vnodes, {self.num_keys:,} keys", font_size=30).to_edge(UP)
+        self.play(Create(ring), Write(title))
+
+        # Step 1: Every vnode in one mobject, colored by its node
+        vnode_points, owners = ch.vnode_positions(self.radius)
+        vnodes = ring_cloud(vnode_points, owner_rgbas(owners), stroke_width=6)
+        labels = VGroup(*[
+            cached_text(nodes[owners[i]], font_size=14, color=PALETTE[owners[i] % len(PALETTE)])
+            .move_to(vnode_points[i] * 1.12)
+            for i in lod_indices(len(vnode_points), self.max_labels)
+        ])
+        self.play(FadeIn(vnodes), FadeIn(labels))
+        self.wait(1)
+
+        # Step 2: Keys just inside the ring, colored by the node that owns them
+        key_points = ring_points(keys, self.radius * 0.9)
+        key_owners = ch.ring.lookup(keys)
+        key_cloud = ring_cloud(key_points, owner_rgbas(key_owners, opacity=0.6), stroke_width=2)
+        self.play(FadeIn(key_cloud))
+        self.wait(1)
+
+        # Step 3: Remove a node; only its keys change color
+        removed = nodes[0]
+        gone = owners == ch.ring.node_index(removed)
+        removed_vnodes = ring_cloud(vnode_points[gone], owner_rgbas(owners[gone]), stroke_width=6)
+        kept_vnodes = ring_cloud(vnode_points[~gone], owner_rgbas(owners[~gone]), stroke_width=6)
+        self.remove(vnodes)
+        self.add(kept_vnodes, removed_vnodes)
+        ch.remove_node(removed)
+        new_owners = ch.ring.lookup(keys)
+        moved = int(np.count_nonzero(new_owners != key_owners))
+        caption = cached_text(
+            f"Removing {removed}: {moved:,} keys ({moved / len(keys):.1%}) move", font_size=24
+        ).to_edge(DOWN)
+        self.play(
+            FadeOut(removed_vnodes),
+            Transform(key_cloud, ring_cloud(key_points, owner_rgbas(new_owners, opacity=0.6), stroke_width=2)),
+            Write(caption),
+        )
+        self.wait(2)
+
+if __name__ == "__main__":
+    from manim import config
+    config.media_dir = "./media"
+    config.quality = "low_quality"
+    scene = LargeRingScene()
+    scene.render()
@@ -0,0 +1,80 @@
+from manim import *
+import numpy as np
+
+from ring_simulator import key_hashes, simulate
+from text_cache import cached_text
+
+class LoadDistributionScene(Scene):
+    # Ring being tuned
+    num_nodes = 100
+    num_keys = 2_000_000
+    vnode_counts = [1, 2, 5, 10, 20, 50, 100, 200]
+    # The chart never has more bars than this; larger rings are bucketed
+    max_bars = 50
+    # Frame budget for the whole sweep, whatever num_keys is
+    max_frames = 300
+
+    def bar_heights(self, load):
+        # Per-node load relative to the mean, sorted from busiest to idlest
+        ratios = np.sort(load / load.mean())[::-1]
+        buckets = np.array_split(ratios, min(self.max_bars, len(ratios)))
+        return np.array([bucket.mean() for bucket in buckets])
+
+    def make_bars(self, heights, scale, width):
+        bar_width = width / len(heights)
+        bars = VGroup(*[
+            Rectangle(
+                width=bar_width * 0.8,
+                height=max(h * scale, 0.01),
+                stroke_width=0,
+                fill_color=interpolate_color(BLUE, RED, min(max(h - 1, 0), 1)),
+                fill_opacity=0.9,
+            )
+            for h in heights
+        ]).arrange(RIGHT, buff=bar_width * 0.2, aligned_edge=DOWN)
+        return bars.move_to(DOWN * 2.5, aligned_edge=DOWN)
+
+    def caption(self, result):
+        return cached_text(
+            f"vnodes={result['vnodes']}   std/mean={result['std_over_mean']:.2f}   "
+            f"max/mean={result['max_over_mean']:.2f}   moved on add={result['moved_on_add']:.2%}",
+            font_size=22,
+        ).to_edge(DOWN, buff=0.3)
+
+    def construct(self):
+        # Step 1: Simulate every vnode count up front
+        keys = key_hashes(self.num_keys)
+        results = [simulate(self.num_nodes, v, self.num_keys, keys=keys) for v in self.vnode_counts]
+        heights = [self.bar_heights(r["load"]) for r in results]
+        chart_width, chart_height = 11, 4.5
+        scale = chart_height / max(h.max() for h in heights)
+
+        title = cached_text("Load per node vs. virtual nodes", font_size=36).to_edge(UP)
+        subtitle = cached_text(
+            f"{self.num_nodes} nodes, {self.num_keys:,} keys (sorted, bars relative to mean load)", font_size=22
+        ).next_to(title, DOWN)
+        baseline = Line(LEFT * chart_width / 2, RIGHT * chart_width / 2).move_to(DOWN * 2.5)
+        mean_line = DashedLine(LEFT * chart_width / 2, RIGHT * chart_width / 2, color=YELLOW).shift(
+            DOWN * 2.5 + UP * scale
+        )
+        mean_label = cached_text("mean", font_size=20, color=YELLOW).next_to(mean_line, RIGHT, buff=0.1)
+        self.play(Write(title), FadeIn(subtitle), Create(baseline))
+
+        # Step 2: Animate the sweep within the frame budget
+        step_time = max(self.max_frames / config.frame_rate / len(results), 1 / config.frame_rate)
+        bars = self.make_bars(heights[0], scale, chart_width)
+        caption = self.caption(results[0])
+        self.play(FadeIn(bars), Create(mean_line), FadeIn(mean_label), Write(caption), run_time=step_time)
+        for result, h in zip(results[1:], heights[1:]):
+            self.play(
+                Transform(bars, self.make_bars(h, scale, chart_width)),
+                Transform(caption, self.caption(result)),
+                run_time=step_time,
+            )
+        self.wait(2)
+
+if __name__ == "__main__":
+    from manim import config
+    config.media_dir = "./media"
+    scene = LoadDistributionScene()
+    scene.render()
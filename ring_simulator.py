@@ -0,0 +1,102 @@
+"""Vectorized load-distribution simulator for the consistent hash ring.
+
+    python ring_simulator.py --nodes 100 --vnodes 1,10,50,100,200 --keys 5000000
+
+For N nodes with V vnodes each and M keys it reports the per-node load
+spread (std/mean, max/mean, min/mean) and the fraction of keys that move
+when a node is added or removed, next to the ideal fraction. Keys are
+synthetic 64-bit hashes (splitmix64 over a counter), so millions of them
+cost milliseconds; the ring uses the same HashRing as the scenes.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from hash_ring import HashRing
+from hashers import DEFAULT_HASHER, HASHERS
+
+
+def splitmix64(x):
+    x = np.asarray(x, dtype=np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def key_hashes(num_keys, seed=0):
+    # Sorted, because searchsorted over sorted queries is far more cache friendly
+    return np.sort(splitmix64(np.arange(num_keys, dtype=np.uint64) + np.uint64(seed * num_keys)))
+
+
+def load_stats(load):
+    mean = load.mean()
+    return {
+        "std_over_mean": float(load.std() / mean),
+        "max_over_mean": float(load.max() / mean),
+        "min_over_mean": float(load.min() / mean),
+    }
+
+
+def simulate(num_nodes, vnodes, num_keys, hasher=DEFAULT_HASHER, seed=0, keys=None):
+    """Simulate one ring configuration; returns loads and movement statistics."""
+    names = [f"node{i}" for i in range(num_nodes)]
+    keys = key_hashes(num_keys, seed) if keys is None else keys
+    ring = HashRing(vnodes, hasher=hasher)
+    ring.add_nodes(names)
+    owners = ring.lookup(keys)
+    load = np.bincount(owners, minlength=num_nodes)
+
+    # Add one node: only keys that now land on it may move
+    ring.add_nodes([f"node{num_nodes}"])
+    moved_add = float(np.mean(ring.lookup(keys) != owners))
+    ring.remove_nodes([f"node{num_nodes}"])
+
+    # Remove the first node: exactly its keys move
+    ring.remove_nodes([names[0]])
+    moved_remove = float(np.mean(ring.lookup(keys) != owners))
+
+    return {
+        "nodes": num_nodes,
+        "vnodes": vnodes,
+        "keys": len(keys),
+        "load": load,
+        **load_stats(load),
+        "moved_on_add": moved_add,
+        "ideal_moved_on_add": 1 / (num_nodes + 1),
+        "moved_on_remove": moved_remove,
+        "ideal_moved_on_remove": 1 / num_nodes,
+    }
+
+
+def sweep(num_nodes, vnode_counts, num_keys, hasher=DEFAULT_HASHER, seed=0):
+    keys = key_hashes(num_keys, seed)
+    return [simulate(num_nodes, v, num_keys, hasher, seed, keys) for v in vnode_counts]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate key distribution on a consistent hash ring.")
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--vnodes", default="1,10,50,100,200", help="Comma separated vnode counts to compare")
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--hasher", choices=sorted(HASHERS), default=DEFAULT_HASHER)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    vnode_counts = [int(v) for v in args.vnodes.split(",")]
+    print(f"{args.nodes} nodes, {args.keys:,} keys, hasher={args.hasher}")
+    print(f"{'vnodes':>7} {'std/mean':>9} {'max/mean':>9} {'min/mean':>9} {'moved+1':>9} {'ideal':>7} {'moved-1':>9} {'ideal':>7}")
+    for r in sweep(args.nodes, vnode_counts, args.keys, args.hasher, args.seed):
+        print(
+            f"{r['vnodes']:>7} {r['std_over_mean']:>9.3f} {r['max_over_mean']:>9.3f} {r['min_over_mean']:>9.3f}"
+            f" {r['moved_on_add']:>9.2%} {r['ideal_moved_on_add']:>7.2%}"
+            f" {r['moved_on_remove']:>9.2%} {r['ideal_moved_on_remove']:>7.2%}"
+        )
+    print(f"Done in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""Single-pass fan-out encoder: one scene render, several video files.
+
+Usage:
+    python stream_encoder.py FILE [-s SCENE] [-q h] [--formats mp4,webm,gif]
+                             [--gif-fps 10] [--gif-width 480] [--qualities l,m,h]
+
+Raw frames are piped once into a single ffmpeg process whose filter graph
+splits them into every requested output: H.264 MP4, VP9 WebM and a GIF with
+duplicate frames dropped (mpdecimate) and one palette computed over the whole
+scene. No partial movies or intermediate MP4 are written.
+
+With --qualities the scene is constructed and rasterized once, at the highest
+of those presets, and the same frames are also subsampled (60 -> 30 -> 15fps)
+and scaled down into the other presets' folders, e.g. 480p15/ and 720p30/
+next to 1080p60/, instead of running construct() once per preset.
+"""
+import argparse
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from render_all import QUALITIES, discover_scenes, render_scene
+
+FORMATS = ("mp4", "webm", "gif")
+
+CODEC_ARGS = {
+    "mp4": ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18", "-movflags", "+faststart"],
+    "webm": ["-c:v", "libvpx-vp9", "-pix_fmt", "yuv420p", "-b:v", "0", "-crf", "32", "-row-mt", "1"],
+    # Variable frame rate so the frames mpdecimate drops become longer delays
+    "gif": ["-vsync", "vfr", "-loop", "0"],
+}
+
+
+def ffmpeg_executable():
+    try:
+        from manim import config
+
+        configured = getattr(config, "ffmpeg_executable", None)
+    except ImportError:
+        configured = None
+    executable = configured or shutil.which("ffmpeg")
+    if not executable:
+        raise RuntimeError("ffmpeg was not found on PATH")
+    return str(executable)
+
+
+class FanOutEncoder:
+    """Encode raw RGBA frames into several outputs with one ffmpeg process.
+
+    Each output is a dict with `path` and `format` ("mp4", "webm" or "gif"),
+    and optionally `fps` and `width`/`height` to resample that output only.
+    GIF outputs also take `gif_fps` and `gif_width` (default 10 and 480).
+    """
+
+    def __init__(self, width, height, fps, outputs):
+        self.width, self.height, self.fps = width, height, fps
+        self.outputs = [dict(o, path=Path(o["path"])) for o in outputs]
+        self.frames_in = 0
+        self.process = None
+
+    def _output_filter(self, index, output):
+        filters = []
+        if output["format"] == "gif":
+            filters.append(f"fps={output.get('gif_fps', 10)}")
+            filters.append(f"scale={output.get('gif_width', 480)}:-1:flags=lanczos")
+            filters.append("mpdecimate")
+            return (
+                f"[v{index}]{','.join(filters)},split[g{index}a][g{index}b];"
+                f"[g{index}a]palettegen[p{index}];[g{index}b][p{index}]paletteuse[out{index}]"
+            )
+        if output.get("fps") and output["fps"] != self.fps:
+            filters.append(f"fps={output['fps']}")
+        if output.get("width") and (output["width"], output.get("height")) != (self.width, self.height):
+            filters.append(f"scale={output['width']}:{output.get('height', -2)}:flags=lanczos")
+        return f"[v{index}]{','.join(filters) or 'null'}[out{index}]"
+
+    def command(self):
+        count = len(self.outputs)
+        graph = [f"[0:v]split={count}" + "".join(f"[v{i}]" for i in range(count))]
+        graph += [self._output_filter(i, o) for i, o in enumerate(self.outputs)]
+        cmd = [
+            ffmpeg_executable(),
+            "-y",
+            "-loglevel", "error",
+            "-f", "rawvideo",
+            "-pix_fmt", "rgba",
+            "-s", f"{self.width}x{self.height}",
+            "-r", str(self.fps),
+            "-i", "-",
+            "-filter_complex", ";".join(graph),
+        ]
+        for i, output in enumerate(self.outputs):
+            cmd += ["-map", f"[out{i}]", *CODEC_ARGS[output["format"]], str(output["path"])]
+        return cmd
+
+    def open(self):
+        for output in self.outputs:
+            output["path"].parent.mkdir(parents=True, exist_ok=True)
+        self.process = subprocess.Popen(self.command(), stdin=subprocess.PIPE)
+
+    def write(self, frame, num_frames=1):
+        if self.process is None:
+            self.open()
+        data = frame.tobytes()
+        for _ in range(num_frames):
+            self.process.stdin.write(data)
+        self.frames_in += num_frames
+
+    def close(self):
+        if self.process is None:
+            return
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with code {self.process.returncode}")
+        self.process = None
+
+
+class StreamingFileWriterMixin:
+    """SceneFileWriter mixin that streams frames into a FanOutEncoder.
+
+    Replaces manim's partial movies and final concatenation; subclasses set
+    `formats` and the GIF options (see streaming_writer()).
+    """
+
+    formats = ("mp4",)
+    gif_fps = 10
+    gif_width = 480
+    # Other presets (render_all.QUALITIES letters) encoded from the same frames
+    qualities = ()
+
+    def stream_outputs(self):
+        from manim import config
+
+        movie = Path(self.movie_file_path)
+        outputs = [
+            {"path": movie.with_suffix(f".{fmt}"), "format": fmt, "gif_fps": self.gif_fps, "gif_width": self.gif_width}
+            for fmt in self.formats
+        ]
+        rendered = (config.pixel_width, config.pixel_height, int(config.frame_rate))
+        for letter in self.qualities:
+            width, height, fps = quality_settings(letter)
+            if (width, height, fps) == rendered:
+                continue
+            # Same layout as manim's own media/videos/<module>/<height>p<fps>/
+            path = movie.parent.with_name(f"{height}p{fps}") / movie.name
+            outputs += [
+                {"path": path.with_suffix(f".{fmt}"), "format": fmt, "fps": fps, "width": width, "height": height}
+                for fmt in self.formats
+                if fmt != "gif"
+            ]
+        return outputs
+
+    def _encoder(self):
+        if getattr(self, "encoder", None) is None:
+            from manim import config
+
+            self.encoder = FanOutEncoder(config.pixel_width, config.pixel_height, config.frame_rate, self.stream_outputs())
+        return self.encoder
+
+    def is_already_cached(self, hash_invocation):
+        return False  # every frame has to reach the encoder
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        pass
+
+    def end_animation(self, allow_write=False):
+        pass
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        frame = frame_or_renderer.get_frame() if hasattr(frame_or_renderer, "get_frame") else frame_or_renderer
+        self._encoder().write(frame, num_frames)
+
+    def finish(self):
+        from manim import logger
+
+        encoder = self._encoder()
+        encoder.close()
+        for output in encoder.outputs:
+            logger.info("File ready at %(path)s", {"path": str(output["path"])})
+
+
+def quality_settings(letter):
+    """(pixel_width, pixel_height, frame_rate) of a quality preset letter."""
+    from manim.constants import QUALITIES as MANIM_QUALITIES
+
+    preset = MANIM_QUALITIES[QUALITIES[letter]]
+    return preset["pixel_width"], preset["pixel_height"], int(preset["frame_rate"])
+
+
+def highest_quality(letters):
+    # render_all.QUALITIES is ordered from lowest to highest
+    order = list(QUALITIES)
+    return max(letters, key=order.index)
+
+
+def streaming_writer(formats=FORMATS, gif_fps=10, gif_width=480, qualities=()):
+    return type(
+        "StreamingFileWriter",
+        (StreamingFileWriterMixin,),
+        {"formats": tuple(formats), "gif_fps": gif_fps, "gif_width": gif_width, "qualities": tuple(qualities)},
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a scene straight into MP4, WebM and/or GIF.")
+    parser.add_argument("file")
+    parser.add_argument("-s", "--scene", default="*")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("--formats", default="mp4,webm,gif", help="Comma separated subset of mp4,webm,gif")
+    parser.add_argument("--gif-fps", type=int, default=10)
+    parser.add_argument("--gif-width", type=int, default=480)
+    parser.add_argument(
+        "--qualities", default=None, help="Comma separated presets, e.g. l,m,h, from one render at the highest (overrides -q)"
+    )
+    parser.add_argument("--media-dir", default="media")
+    args = parser.parse_args(argv)
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    unknown = sorted(set(formats) - set(FORMATS))
+    if unknown or not formats:
+        parser.error(f"unknown format(s) {unknown}; choose from {', '.join(FORMATS)}")
+
+    qualities = [q.strip() for q in (args.qualities or "").split(",") if q.strip()]
+    unknown = sorted(set(qualities) - set(QUALITIES))
+    if unknown:
+        parser.error(f"unknown quality {unknown}; choose from {', '.join(QUALITIES)}")
+    quality = highest_quality(qualities) if qualities else args.quality
+
+    writer = streaming_writer(formats, args.gif_fps, args.gif_width, qualities)
+    status = 0
+    for path, name, _ in discover_scenes([args.file], args.scene):
+        result = render_scene(
+            path,
+            name,
+            quality,
+            args.media_dir,
+            config_overrides={"disable_caching": True},
+            writer_mixins=(writer,),
+        )
+        ok = " ok " if result["ok"] else "FAIL"
+        movie = Path(result.get("output", "x"))
+        outputs = [movie.with_suffix(f".{f}") for f in formats]
+        if result["ok"]:
+            for letter in qualities:
+                _, height, fps = quality_settings(letter)
+                other = movie.parent.with_name(f"{height}p{fps}") / movie.name
+                outputs += [other.with_suffix(f".{f}") for f in formats if f != "gif" and other != movie]
+        outputs = ", ".join(str(o) for o in outputs)
+        print(f"[{ok}] {result['file']}:{name}  {result['seconds']:.1f}s  {outputs if result['ok'] else ''}")
+        if not result["ok"]:
+            print(result["error"], file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from hash_ring import HashRing
+
+
+class FixedHasher:
+    """Places vnodes ("node:replica") and keys at chosen ring positions."""
+
+    def __init__(self, positions):
+        self.positions = positions
+
+    def hash(self, key):
+        return self.positions[key]
+
+    def hash_many(self, keys):
+        return np.array([self.positions[k] for k in keys], dtype=np.uint64)
+
+
+def keys(n):
+    return [f"key:{i}" for i in range(n)]
+
+
+def test_colliding_vnodes_are_ordered_by_node_name():
+    hasher = FixedHasher({"b:0": 100, "a:0": 100, "c:0": 50})
+    together = HashRing(1, hasher=hasher)
+    together.add_nodes(["b", "c", "a"])
+    # Adding "a" later lands on "b"'s position and takes the re-sort path
+    one_by_one = HashRing(1, hasher=hasher)
+    one_by_one.add_nodes(["b", "c"])
+    one_by_one.add_nodes(["a"])
+    for ring in (together, one_by_one):
+        assert ring.positions.tolist() == [50, 100, 100]
+        assert [ring.node_names[i] for i in ring.owners] == ["c", "a", "b"]
+        # The first vnode at or after a position wins, so "a" shadows "b"
+        assert ring.node_names[int(ring.lookup([75])[0])] == "a"
+
+
+def test_lookup_takes_the_next_vnode_and_wraps_around():
+    ring = HashRing(1, hasher=FixedHasher({"a:0": 100, "b:0": 200}))
+    ring.add_nodes(["a", "b"])
+    owners = [ring.node_names[i] for i in ring.lookup([0, 99, 100, 150, 200, 250, 2**64 - 1])]
+    # A vnode owns [previous vnode, itself): a hash equal to a position belongs to the next vnode
+    assert owners == ["a", "a", "b", "b", "a", "a", "a"]
+
+
+def test_empty_ring():
+    ring = HashRing(3)
+    assert ring.get_node("key") is None
+    with pytest.raises(LookupError):
+        ring.lookup([1])
+
+
+def test_adding_a_node_only_moves_keys_to_it():
+    ring = HashRing(100)
+    ring.add_nodes([f"node{i}" for i in range(10)])
+    hashes = ring.hash_many(keys(20_000))
+    before = ring.lookup(hashes)
+    ring.add_nodes(["node10"])
+    after = ring.lookup(hashes)
+    moved = before != after
+    assert moved.any()
+    assert (after[moved] == ring.node_index("node10")).all()
+    # Roughly its fair share of the keys
+    assert 0.05 < moved.mean() < 0.15
+
+
+def test_removing_a_node_only_moves_its_keys():
+    ring = HashRing(100)
+    ring.add_nodes([f"node{i}" for i in range(10)])
+    hashes = ring.hash_many(keys(20_000))
+    before = ring.lookup(hashes)
+    removed = ring.node_index("node3")
+    ring.remove_nodes(["node3"])
+    after = ring.lookup(hashes)
+    assert ((before != after) == (before == removed)).all()
+    assert not (after == removed).any()
+    # Adding it back restores the original assignment
+    ring.add_nodes(["node3"])
+    assert (ring.lookup(hashes) == before).all()
+
+
+def test_remove_nodes_accepts_a_generator():
+    ring = HashRing(num_replicas=5)
+    ring.add_nodes(["a", "b"])
+    ring.remove_nodes(n for n in ["a"])
+    assert ring.nodes == {"b"}
+    assert len(ring) == 5
+    # The node can come back after being removed through a generator
+    ring.add_nodes(["a"])
+    assert ring.nodes == {"a", "b"}
+    assert len(ring) == 10
+
+
+def test_add_nodes_accepts_a_generator():
+    ring = HashRing(num_replicas=5)
+    ring.add_nodes(n for n in ["a", "b", "a"])
+    assert ring.nodes == {"a", "b"}
+    assert len(ring) == 10
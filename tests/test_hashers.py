@@ -0,0 +1,10 @@
+from hashers import HASHERS
+
+
+def test_hash_many_accepts_any_iterable():
+    keys = ["a", "bb", "ccc"]
+    for cls in HASHERS.values():
+        hasher = cls()
+        assert list(hasher.hash_many(k for k in keys)) == list(hasher.hash_many(keys))
+        assert list(hasher.hash_many(keys)) == [hasher.hash(k) for k in keys]
+        assert len(hasher.hash_many(iter([]))) == 0
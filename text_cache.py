@@ -0,0 +1,109 @@
+"""Memoizing Text factory shared across scenes and renders.
+
+    from text_cache import cached_text
+    label = cached_text("Node A", font_size=24).next_to(dot, UP)
+
+The first call for a given (text, font, font_size, color, weight, ...) pays
+for the Pango layout and SVG parsing; later calls return a copy of the cached
+template. With a disk directory enabled (TEXT_CACHE_DIR, or
+enable_disk_cache()), templates are also pickled so the next render starts
+warm.
+"""
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+
+from manim import Text, __version__
+
+_templates = {}
+_build_seconds = {}
+_disk_dir = Path(os.environ["TEXT_CACHE_DIR"]) if os.environ.get("TEXT_CACHE_DIR") else None
+
+stats = {"hits": 0, "disk_hits": 0, "misses": 0, "build_seconds": 0.0, "saved_seconds": 0.0}
+
+
+def enable_disk_cache(directory):
+    global _disk_dir
+    _disk_dir = Path(directory) if directory else None
+
+
+def _key(text, kwargs):
+    return repr((text, sorted((name, str(value)) for name, value in kwargs.items())))
+
+
+def _disk_path(key):
+    digest = hashlib.sha256(f"{__version__}\0{key}".encode()).hexdigest()
+    return _disk_dir / f"{digest}.pickle"
+
+
+def _load(key):
+    if _disk_dir is None:
+        return None
+    path = _disk_path(key)
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _save(key, entry):
+    if _disk_dir is None:
+        return
+    path = _disk_path(key)
+    try:
+        _disk_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        pass  # an unpicklable template only loses the disk layer
+
+
+def cached_text(text, **kwargs):
+    """Return a fresh copy of Text(text, **kwargs), building it at most once."""
+    key = _key(text, kwargs)
+    template = _templates.get(key)
+    if template is not None:
+        stats["hits"] += 1
+        stats["saved_seconds"] += _build_seconds[key]
+        return template.copy()
+
+    start = time.perf_counter()
+    entry = _load(key)
+    if entry is not None:
+        build_seconds, template = entry
+        stats["disk_hits"] += 1
+        stats["saved_seconds"] += max(0.0, build_seconds - (time.perf_counter() - start))
+    else:
+        template = Text(text, **kwargs)
+        build_seconds = time.perf_counter() - start
+        stats["misses"] += 1
+        stats["build_seconds"] += build_seconds
+        _save(key, (build_seconds, template))
+
+    _templates[key] = template
+    _build_seconds[key] = build_seconds
+    return template.copy()
+
+
+def snapshot(reset=False):
+    counts = dict(stats, templates=len(_templates))
+    if reset:
+        for name in stats:
+            stats[name] = type(stats[name])()
+    return counts
+
+
+def report():
+    s = snapshot()
+    return (
+        f"Text cache: {s['hits']} hit(s), {s['disk_hits']} disk hit(s), {s['misses']} miss(es), "
+        f"{s['build_seconds']:.2f}s building, {s['saved_seconds']:.2f}s saved"
+    )
@@ -0,0 +1,125 @@
+from pathlib import Path
+
+from manim import *
+import numpy as np
+
+from hash_ring import HashRing
+from ring_cloud import ring_angles
+from text_cache import cached_text
+from trace_replay import generate_trace, parse_nodes, replay
+
+def heat_color(h):
+    # 0 -> blue, 0.5 -> yellow, 1 -> red
+    if h < 0.5:
+        return interpolate_color(BLUE, YELLOW, h * 2)
+    return interpolate_color(YELLOW, RED, h * 2 - 1)
+
+
+class TraceHeatmapScene(Scene):
+    # Trace to replay; a synthetic one is generated here if it does not exist
+    trace = "traces/sample.csv"
+    nodes = "10"
+    num_replicas = 12
+    bucket_seconds = 60
+    # Length of the replay in the video, whatever the trace length
+    replay_seconds = 12
+
+    def ensure_trace(self):
+        path = Path(self.trace)
+        if not path.exists():
+            generate_trace(
+                path, 1_000_000, num_keys=50_000, duration=3600,
+                events=[(1200, "join", "node10"), (2400, "leave", "node3"), (3000, "join", "node3")],
+            )
+        return path
+
+    def arc_owners(self, result, nodes):
+        # The ring only changes at join/leave events. For each ring state, the
+        # owner (rate column) of every arc of the union ring, and the bucket it starts at
+        columns = {name: i for i, name in enumerate(result["rates"].columns)}
+        union = HashRing(self.num_replicas)
+        union.add_nodes([*nodes, *result["events"]["node"]])
+        # Keys just below a union vnode belong to the first active vnode at or after it
+        probes = union.positions - np.uint64(1)
+        ring = HashRing(self.num_replicas)
+        ring.add_nodes(nodes)
+
+        def owners():
+            return np.array([columns[ring.node_names[i]] for i in ring.lookup(probes)])
+
+        buckets = result["rates"].index.to_numpy()
+        states = [(0, owners())]
+        for event in result["events"].itertuples():
+            if event.event == "join":
+                ring.add_nodes([event.node])
+            else:
+                ring.remove_nodes([event.node])
+            states.append((int(np.searchsorted(buckets, event.timestamp)), owners()))
+        return union, states
+
+    def construct(self):
+        nodes = parse_nodes(self.nodes)
+        result = replay(self.ensure_trace(), nodes, self.num_replicas, self.bucket_seconds)
+        rates = result["rates"]
+        values = rates.to_numpy()
+        peak = values.max()
+        union, states = self.arc_owners(result, nodes)
+
+        # Step 1: One arc per vnode of every node that ever appears in the trace
+        angles = ring_angles(union.positions)
+        arcs = VGroup(*[
+            Arc(radius=3, start_angle=start, angle=(end - start) % TAU, stroke_width=24)
+            for start, end in zip(np.roll(angles, 1), angles)
+        ])
+        title = cached_text(f"Replaying {Path(self.trace).name}: {result['requests']:,} requests", font_size=28)
+        title.to_edge(UP)
+        legend = VGroup(
+            cached_text("idle", font_size=18, color=BLUE),
+            Rectangle(width=2, height=0.15, stroke_width=0, fill_opacity=1).set_fill(color=[BLUE, YELLOW, RED]),
+            cached_text(f"{peak:,.0f} req/s", font_size=18, color=RED),
+        ).arrange(RIGHT, buff=0.2).to_corner(DR)
+        self.play(Create(arcs), Write(title), FadeIn(legend))
+
+        # Step 2: Sweep through the time buckets
+        clock = ValueTracker(0)
+        state_starts = [start for start, _ in states]
+
+        def recolor(group):
+            t = clock.get_value()
+            b = min(int(t), len(values) - 1)
+            frac = t - b
+            row = values[b] * (1 - frac) + values[min(b + 1, len(values) - 1)] * frac
+            owners = states[int(np.searchsorted(state_starts, b, side="right")) - 1][1]
+            for arc, h in zip(group, row[owners] / peak):
+                arc.set_stroke(color=heat_color(h))
+
+        def caption_for(b):
+            minute = int(rates.index[b] // 60)
+            happened = result["events"][result["events"]["timestamp"] <= rates.index[b]]
+            last = f"   last: {happened.iloc[-1]['event']} {happened.iloc[-1]['node']}" if len(happened) else ""
+            return cached_text(f"t = {minute:>3} min{last}", font_size=24).to_edge(DOWN)
+
+        caption = caption_for(0)
+        caption.bucket = 0
+
+        def update_caption(mob):
+            b = min(int(clock.get_value()), len(values) - 1)
+            if b != mob.bucket:
+                mob.become(caption_for(b))
+                mob.bucket = b
+
+        recolor(arcs)
+        arcs.add_updater(recolor)
+        caption.add_updater(update_caption)
+        self.add(caption)
+        self.play(clock.animate.set_value(len(values) - 1), run_time=self.replay_seconds, rate_func=linear)
+        arcs.clear_updaters()
+        caption.clear_updaters()
+        self.wait(2)
+
+if __name__ == "__main__":
+    from manim import config
+    config.media_dir = "./media"
+    config.quality = "low_quality"
+    scene = TraceHeatmapScene()
+    scene.render()
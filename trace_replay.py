@@ -0,0 +1,258 @@
+"""Replay a key-access log through the consistent hash ring.
+
+    python trace_replay.py generate traces/sample.csv --requests 5000000 --join 1200:node10 --leave 2400:node3
+    python trace_replay.py replay traces/sample.csv --nodes 10 --replicas 100 --bucket 60
+
+A trace is a CSV with `timestamp` (seconds) and `key` columns, and optionally
+an `event` column: `get` for an access (the default), `join` or `leave` with
+the node name in `key` for membership changes. It is read in fixed-size
+chunks; each chunk's distinct keys are hashed once and assigned through
+ConsistentHashingVisualizer's ring in one vectorized lookup, and requests
+are summed per node and time bucket, so memory depends on the chunk size,
+the number of buckets and the key cache size, not on the trace length.
+
+Owners of recently seen keys are kept in KeyAssignments; a leave reassigns
+only the keys of the node that left and a join only the keys that fall in
+the arcs taken by the new vnodes.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from hashers import DEFAULT_HASHER
+from ring_simulator import splitmix64
+
+
+class KeyAssignments:
+    """Owners of recently seen key hashes, kept in step with the ring."""
+
+    def __init__(self, ring, max_keys=1_000_000):
+        self.ring = ring
+        self.max_keys = max_keys
+        self.hashes = np.empty(0, dtype=np.uint64)  # sorted
+        self.owners = np.empty(0, dtype=np.int64)
+        self.last_seen = np.empty(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def assign(self, hashes, tick=0):
+        """Owners for sorted, distinct `hashes`; unseen keys are looked up and remembered."""
+        slots = np.searchsorted(self.hashes, hashes)
+        if len(self.hashes):
+            known = self.hashes[np.minimum(slots, len(self.hashes) - 1)] == hashes
+        else:
+            known = np.zeros(len(hashes), dtype=bool)
+        owners = np.empty(len(hashes), dtype=np.int64)
+        owners[known] = self.owners[slots[known]]
+        self.last_seen[slots[known]] = tick
+        new = ~known
+        if new.any():
+            owners[new] = self.ring.lookup(hashes[new])
+            self.hashes = np.insert(self.hashes, slots[new], hashes[new])
+            self.owners = np.insert(self.owners, slots[new], owners[new])
+            self.last_seen = np.insert(self.last_seen, slots[new], tick)
+        if len(self.hashes) > self.max_keys:
+            # Forget the keys seen least recently
+            keep = np.sort(np.argpartition(-self.last_seen, self.max_keys)[: self.max_keys])
+            self.hashes, self.owners, self.last_seen = self.hashes[keep], self.owners[keep], self.last_seen[keep]
+        return owners
+
+    def node_left(self, index):
+        """Reassign the keys of a node already removed from the ring; returns how many moved."""
+        moved = np.flatnonzero(self.owners == index)
+        if len(moved):
+            self.owners[moved] = self.ring.lookup(self.hashes[moved])
+        return len(moved)
+
+    def node_joined(self, index):
+        """Give a node already added to the ring the keys in its arcs; returns how many moved."""
+        positions = self.ring.positions
+        ends = np.flatnonzero(self.ring.owners == index)
+        if not len(ends) or not len(self.hashes):
+            return 0
+        # A vnode owns [previous vnode, itself); the first vnode's arc wraps around zero
+        starts = positions[ends - 1]
+        lo = np.searchsorted(self.hashes, starts)
+        hi = np.searchsorted(self.hashes, positions[ends])
+        wraps = ends == 0
+        hi[wraps] = len(self.hashes)
+        ranges = [np.arange(a, b) for a, b in zip(lo, hi)]
+        if wraps.any():
+            ranges.append(np.arange(0, np.searchsorted(self.hashes, positions[0])))
+        moved = np.unique(np.concatenate(ranges)) if ranges else np.empty(0, dtype=np.int64)
+        moved = moved[self.owners[moved] != index]
+        self.owners[moved] = index
+        return len(moved)
+
+
+def _accesses(ch, assignments, keys, tick):
+    # Hash each distinct key of the chunk once
+    codes, uniques = pd.factorize(keys)
+    hashes = ch.ring.hash_many(list(uniques))
+    order = np.argsort(hashes)
+    owners = np.empty(len(hashes), dtype=np.int64)
+    owners[order] = assignments.assign(hashes[order], tick)
+    return owners[codes]
+
+
+def replay(path, nodes, num_replicas=100, bucket_seconds=60, chunksize=1_000_000, max_keys=1_000_000, hasher=DEFAULT_HASHER):
+    """Stream a trace through the ring.
+
+    Returns {"rates": DataFrame of requests/second (bucket start x node),
+    "events": DataFrame of membership changes with the keys each moved,
+    "requests", "chunks", "seconds"}.
+    """
+    from consistent_hashing_visual import ConsistentHashingVisualizer
+
+    start = time.perf_counter()
+    ch = ConsistentHashingVisualizer(num_replicas=num_replicas, hasher=hasher)
+    ch.add_nodes(nodes)
+    assignments = KeyAssignments(ch.ring, max_keys)
+    counts = {}  # (bucket, node index) -> requests
+    events = []
+    requests = chunks = 0
+
+    def count(timestamps, keys, tick):
+        owners = _accesses(ch, assignments, keys, tick)
+        buckets = (timestamps // bucket_seconds).astype(np.int64)
+        pairs, n = np.unique(buckets << 20 | owners, return_counts=True)
+        for pair, value in zip(pairs.tolist(), n.tolist()):
+            key = (pair >> 20, pair & 0xFFFFF)
+            counts[key] = counts.get(key, 0) + value
+
+    for chunk in pd.read_csv(path, chunksize=chunksize, dtype={"key": str}):
+        chunks += 1
+        timestamps = chunk["timestamp"].to_numpy(dtype=np.float64)
+        keys = chunk["key"].to_numpy()
+        if "event" in chunk:
+            event_rows = np.flatnonzero(chunk["event"].fillna("get").to_numpy() != "get")
+        else:
+            event_rows = np.empty(0, dtype=np.int64)
+        begin = 0
+        for row in [*event_rows, len(chunk)]:
+            if row > begin:
+                count(timestamps[begin:row], keys[begin:row], chunks)
+                requests += row - begin
+            if row < len(chunk):
+                event, node = chunk["event"].iat[row], keys[row]
+                if event == "join":
+                    ch.add_node(node)
+                    moved = assignments.node_joined(ch.ring.node_index(node))
+                elif event == "leave":
+                    ch.remove_node(node)
+                    moved = assignments.node_left(ch.ring.node_index(node))
+                else:
+                    raise ValueError(f"unknown event {event!r} at timestamp {timestamps[row]}")
+                events.append({"timestamp": timestamps[row], "event": event, "node": node, "moved": moved})
+            begin = row + 1
+
+    names = ch.ring.node_names
+    if counts:
+        series = pd.Series(counts)
+        series.index = pd.MultiIndex.from_tuples(
+            [(b * bucket_seconds, names[n]) for b, n in series.index], names=["bucket", "node"]
+        )
+        rates = series.unstack("node", fill_value=0).sort_index() / bucket_seconds
+        rates = rates.reindex(columns=names, fill_value=0)
+    else:
+        rates = pd.DataFrame(columns=names)
+    return {
+        "rates": rates,
+        "events": pd.DataFrame(events, columns=["timestamp", "event", "node", "moved"]),
+        "requests": requests,
+        "chunks": chunks,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def generate_trace(path, num_requests, num_keys=100_000, duration=3600, events=(), skew=1.1, seed=0, chunksize=1_000_000):
+    """Write a synthetic trace: Zipf-distributed keys at uniform times, plus (timestamp, event, node) rows."""
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Zipf over key ranks, shuffled so popular keys are spread over the ring
+    ranks = np.arange(1, num_keys + 1, dtype=np.float64)
+    weights = ranks ** -skew
+    weights /= weights.sum()
+    names = np.char.add("key", splitmix64(np.arange(num_keys)).astype(str))
+    events = sorted(events)
+    with path.open("w") as f:
+        f.write("timestamp,event,key\n")
+        step = duration / max(num_requests, 1)
+        for first in range(0, num_requests, chunksize):
+            n = min(chunksize, num_requests - first)
+            timestamps = (first + np.arange(n)) * step
+            frame = pd.DataFrame({
+                "timestamp": np.round(timestamps, 3),
+                "event": "get",
+                "key": names[rng.choice(num_keys, size=n, p=weights)],
+            })
+            # Membership changes that fall inside this chunk
+            inside = [e for e in events if first * step <= e[0] < (first + n) * step]
+            if inside:
+                extra = pd.DataFrame(inside, columns=["timestamp", "event", "key"])
+                frame = pd.concat([frame, extra]).sort_values("timestamp", kind="stable")
+            frame.to_csv(f, header=False, index=False)
+
+
+def parse_nodes(value):
+    # "10" -> node0..node9, otherwise a comma separated list
+    return [f"node{i}" for i in range(int(value))] if value.isdigit() else value.split(",")
+
+
+def _parse_event(kind):
+    def parse(value):
+        timestamp, node = value.split(":", 1)
+        return float(timestamp), kind, node
+
+    return parse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a key-access trace through the consistent hash ring.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("generate", help="Write a synthetic trace")
+    gen.add_argument("path")
+    gen.add_argument("--requests", type=int, default=1_000_000)
+    gen.add_argument("--keys", type=int, default=100_000)
+    gen.add_argument("--duration", type=float, default=3600, help="Trace length in seconds")
+    gen.add_argument("--join", type=_parse_event("join"), action="append", default=[], metavar="SECONDS:NODE")
+    gen.add_argument("--leave", type=_parse_event("leave"), action="append", default=[], metavar="SECONDS:NODE")
+    gen.add_argument("--seed", type=int, default=0)
+
+    rep = commands.add_parser("replay", help="Aggregate per-node request rates")
+    rep.add_argument("path")
+    rep.add_argument("--nodes", default="10", help="Initial nodes: a count or a comma separated list")
+    rep.add_argument("--replicas", type=int, default=100)
+    rep.add_argument("--bucket", type=float, default=60, help="Bucket width in seconds")
+    rep.add_argument("--chunksize", type=int, default=1_000_000)
+    rep.add_argument("--max-keys", type=int, default=1_000_000, help="Key owners remembered between chunks")
+    rep.add_argument("--output", default=None, help="Write the per-bucket rates to this CSV")
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        generate_trace(args.path, args.requests, args.keys, args.duration, args.join + args.leave, seed=args.seed)
+        return 0
+
+    result = replay(args.path, parse_nodes(args.nodes), args.replicas, args.bucket, args.chunksize, args.max_keys)
+    rates = result["rates"]
+    print(f"{result['requests']:,} requests in {result['chunks']} chunk(s), {len(rates)} buckets, {result['seconds']:.1f}s")
+    for event in result["events"].itertuples():
+        print(f"  t={event.timestamp:>8.0f}s  {event.event:<5} {event.node:<10} {event.moved:,} cached keys moved")
+    if len(rates):
+        total = rates.sum(axis=1)
+        busiest = rates.max(axis=1) / (total / (rates > 0).sum(axis=1))
+        print(f"  peak {total.max():,.1f} req/s; busiest node at {busiest.mean():.2f}x the mean on average")
+    if args.output:
+        rates.to_csv(args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
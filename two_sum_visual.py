@@ -1,96 +1,194 @@
+from collections import deque
+import random
+
 from manim import *
+from text_cache import cached_text
+
+CELL_SPACING = 1.2
+
+
+def two_sum_trace(nums, target, max_steps, hash_rows):
+    # One pass over the input that keeps only what the animation will show:
+    # the last `max_steps` scan steps and the hash map rows visible before them
+    seen = {}
+    history = deque(maxlen=max_steps + hash_rows)  # (index, num, map size after insert)
+    solution = None
+    for i, num in enumerate(nums):
+        j = seen.get(target - num)
+        if j is not None:
+            solution = (j, i)
+            break
+        seen[num] = i
+        history.append((i, num, len(seen)))
+
+    last = solution[1] if solution else len(nums) - 1
+    first = max(0, last - max_steps + 1)
+    before = [entry for entry in history if entry[0] < first]
+    return {
+        "first": first,
+        "last": last,
+        "solution": solution,
+        "rows": [(num, i) for i, num, _ in before[-hash_rows:]],
+        "map_size": before[-1][2] if before else 0,
+    }
+
+
+def random_input(n, seed=0):
+    # Distinct values = 1 (mod 4) never sum to 3 (mod 4), so the planted pair is the only answer
+    rng = random.Random(seed)
+    nums = [4 * v + 1 for v in rng.sample(range(5 * n), n)]
+    i = rng.randrange(n // 2)
+    j = rng.randrange(n - max(1, n // 10), n)
+    nums[j] = 4 * rng.randrange(5 * n) + 2
+    return nums, nums[i] + nums[j]
+
 
 class TwoSumScene(Scene):
+    # Input data (override per render: TwoSumScene(nums=[...], target=...))
+    nums = [2, 7, 11, 15]
+    target = 9
+    # Only this many array cells / hash map rows exist as mobjects
+    window = 8
+    hash_rows = 4
+    # Longer scans fast-forward to the last `max_steps` steps
+    max_steps = 24
+
+    def __init__(self, nums=None, target=None, **kwargs):
+        if nums is not None:
+            self.nums = nums
+        if target is not None:
+            self.target = target
+        super().__init__(**kwargs)
+
+    def make_cell(self, index):
+        box = Rectangle(width=1, height=1, color=WHITE)
+        label = cached_text(str(self.nums[index]), font_size=24).move_to(box.get_center())
+        group = VGroup(box, label)
+        group.index_label = cached_text(f"[{index}]", font_size=20).next_to(group, DOWN)
+        return group
+
+    def relabel_cell(self, cell, index):
+        # Recycle a cell for another element: keep the box, swap the texts
+        cell.submobjects[1] = cached_text(str(self.nums[index]), font_size=24).move_to(cell[0].get_center())
+        new_index = cached_text(f"[{index}]", font_size=20).next_to(cell, DOWN)
+        self.remove(cell.index_label)
+        cell.index_label = new_index
+        cell[0].set_color(WHITE)
+
+    def make_hash_row(self, num, index, row):
+        key_box = Rectangle(width=1.5, height=0.8, color=BLUE)
+        value_box = Rectangle(width=1.5, height=0.8, color=BLUE)
+        key_label = cached_text(f"{num}", font_size=20).move_to(key_box.get_center())
+        value_label = cached_text(f"{index}", font_size=20).move_to(value_box.get_center())
+        entry = VGroup(key_box, key_label, value_box, value_label).arrange(RIGHT, buff=0.2)
+        entry.shift(LEFT * 4 + DOWN * row)
+        return entry
+
     def construct(self):
-        # Input data
-        nums = [2, 7, 11, 15]
-        target = 9
-
-        # Step 1: Display the array
-        array_title = Text("Array: nums", font_size=30).to_edge(UP)
-        boxes = []
-        labels = []
-        for i, num in enumerate(nums):
-            box = Rectangle(width=1, height=1, color=WHITE)
-            label = Text(str(num), font_size=24).move_to(box.get_center())
-            group = VGroup(box, label).shift(RIGHT * i * 1.2 - RIGHT * 2)
-            boxes.append(group)
-            labels.append(Text(f"[{i}]", font_size=20).next_to(group, DOWN))
-        
-        array_group = VGroup(*boxes, *labels)
-        self.play(Write(array_title), Create(array_group))
+        nums, target = self.nums, self.target
+        trace = two_sum_trace(nums, target, self.max_steps, self.hash_rows)
+        window = min(self.window, len(nums))
+
+        # Step 1: Display the array (only the visible window)
+        start = max(0, min(trace["first"], len(nums) - window))
+        array_title = cached_text("Array: nums", font_size=30).to_edge(UP)
+        cells = deque()
+        for slot in range(window):
+            cell = self.make_cell(start + slot).shift(RIGHT * slot * CELL_SPACING - RIGHT * 2)
+            cell.index_label.next_to(cell, DOWN)
+            cells.append(cell)
+        labels = [cell.index_label for cell in cells]
+        self.play(Write(array_title), Create(VGroup(*cells, *labels)))
         self.wait(1)
 
         # Step 2: Display the target
-        target_text = Text(f"Target: {target}", font_size=30, color=YELLOW).to_edge(UP).shift(DOWN * 1.5)
+        target_text = cached_text(f"Target: {target}", font_size=30, color=YELLOW).to_edge(UP).shift(DOWN * 1.5)
         self.play(Write(target_text))
         self.wait(1)
 
         # Step 3: Simulate hash map construction
-        hash_title = Text("Hash Map", font_size=30).shift(UP * 2 + LEFT * 4)
-        hash_map = {}
-        hash_boxes = {}
-        hash_labels = {}
-
+        hash_title = cached_text("Hash Map", font_size=30).shift(UP * 2 + LEFT * 4)
         self.play(Write(hash_title))
-        for i, num in enumerate(nums):
-            complement = target - num
-            if complement in hash_map:
+        rows = deque(self.make_hash_row(num, i, k) for k, (num, i) in enumerate(trace["rows"]))
+        if trace["first"] > 0:
+            # Fast-forward over the steps that are not animated one by one
+            skipped = cached_text(
+                f"... {trace['first']} steps, {trace['map_size']} entries in the map", font_size=20, color=GRAY
+            ).next_to(hash_title, DOWN, buff=0.1)
+            self.play(FadeIn(skipped), *[Create(row) for row in rows])
+            self.wait(0.5)
+            self.play(FadeOut(skipped))
+
+        for i in range(trace["first"], trace["last"] + 1):
+            # Scroll the window so cell i is visible, recycling the leftmost cell
+            while i >= start + window:
+                cell = cells.popleft()
+                start += 1
+                cell.shift(RIGHT * CELL_SPACING * window)
+                self.relabel_cell(cell, start + window - 1)
+                cell.index_label.shift(LEFT * CELL_SPACING)
+                self.play(
+                    *[c.animate.shift(LEFT * CELL_SPACING) for c in [*cells, cell]],
+                    *[c.index_label.animate.shift(LEFT * CELL_SPACING) for c in cells],
+                    FadeIn(cell.index_label, shift=LEFT * CELL_SPACING),
+                    run_time=0.3,
+                )
+                cells.append(cell)
+            current = cells[i - start]
+
+            if trace["solution"] and i == trace["solution"][1]:
                 # Solution found
                 break
-            hash_map[num] = i
-
-            # Animate adding to hash map
-            key_box = Rectangle(width=1.5, height=0.8, color=BLUE)
-            value_box = Rectangle(width=1.5, height=0.8, color=BLUE)
-            key_label = Text(f"{num}", font_size=20).move_to(key_box.get_center())
-            value_label = Text(f"{i}", font_size=20).move_to(value_box.get_center())
-            hash_entry = VGroup(key_box, key_label, value_box, value_label).arrange(RIGHT, buff=0.2)
-            hash_entry.shift(LEFT * 4 + DOWN * (len(hash_map) - 1))
-            hash_boxes[num] = hash_entry
 
+            # Animate adding to the hash map, recycling the oldest row once full
+            if len(rows) == self.hash_rows:
+                oldest = rows.popleft()
+                self.play(
+                    FadeOut(oldest),
+                    *[row.animate.shift(UP) for row in rows],
+                    run_time=0.3,
+                )
+            entry = self.make_hash_row(nums[i], i, len(rows))
+            rows.append(entry)
             self.play(
-                boxes[i].animate.set_color(YELLOW),
-                Create(hash_entry),
+                current.animate.set_color(YELLOW),
+                Create(entry),
                 run_time=1
             )
             self.wait(0.5)
-            self.play(boxes[i].animate.set_color(WHITE))
+            self.play(current.animate.set_color(WHITE))
 
         # Step 4: Highlight the solution
-        solution_found = False
-        for i, num in enumerate(nums):
-            complement = target - num
-            if complement in hash_map and hash_map[complement] != i:
-                solution_found = True
-                idx1, idx2 = hash_map[complement], i
-                
-                # Highlight the two numbers
-                self.play(
-                    boxes[idx1].animate.set_color(GREEN),
-                    boxes[idx2].animate.set_color(GREEN),
-                    Flash(boxes[idx1], color=GREEN),
-                    Flash(boxes[idx2], color=GREEN),
-                    run_time=1
-                )
-                
-                # Show the sum
-                sum_text = Text(f"{nums[idx1]} + {nums[idx2]} = {target}", font_size=30, color=GREEN)
-                sum_text.shift(DOWN * 3)
-                self.play(Write(sum_text))
-                
-                # Show result
-                result = Text(f"Indices: [{idx1}, {idx2}]", font_size=30, color=GREEN).next_to(sum_text, DOWN)
-                self.play(Write(result))
-                break
+        if trace["solution"]:
+            idx1, idx2 = trace["solution"]
+            highlighted = [cells[idx - start] for idx in (idx1, idx2) if start <= idx < start + window]
+            self.play(
+                *[cell.animate.set_color(GREEN) for cell in highlighted],
+                *[Flash(cell, color=GREEN) for cell in highlighted],
+                run_time=1
+            )
+
+            # Show the sum
+            sum_text = cached_text(f"{nums[idx1]} + {nums[idx2]} = {target}", font_size=30, color=GREEN)
+            sum_text.shift(DOWN * 3)
+            self.play(Write(sum_text))
 
-        if not solution_found:
-            self.play(Write(Text("No solution found", font_size=30, color=RED).shift(DOWN * 3)))
+            # Show result
+            result = cached_text(f"Indices: [{idx1}, {idx2}]", font_size=30, color=GREEN).next_to(sum_text, DOWN)
+            self.play(Write(result))
+        else:
+            self.play(Write(cached_text("No solution found", font_size=30, color=RED).shift(DOWN * 3)))
 
         self.wait(2)
 
 if __name__ == "__main__":
+    import sys
     from manim import config
     config.media_dir = "./media"
-    scene = TwoSumScene()
-    scene.render()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        # e.g. python two_sum_visual.py 10000
+        nums, target = random_input(int(sys.argv[1]))
+        scene = TwoSumScene(nums=nums, target=target)
+    else:
+        scene = TwoSumScene()
+    scene.render()